@@ -2,6 +2,8 @@
 Fraud detection API endpoints.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 from typing import List
 from app.schemas.fraud_schemas import (
     FraudDetectionRequest,
@@ -10,9 +12,7 @@ from app.schemas.fraud_schemas import (
     FraudStatisticsResponse,
     ModelPerformanceResponse,
     FeatureImportanceResponse,
-    FeatureImportance,
     FraudDetectionWithInsightsResponse,
-    FraudPredictionWithExplanation,
     FraudInsight
 )
 from app.core.fraud_detection_service import get_fraud_service
@@ -20,7 +20,26 @@ from app.dependencies import get_current_user
 from app.models.auth_models import User
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+def _json_response(model: BaseModel, exclude=None) -> ORJSONResponse:
+    """
+    Serialize a response schema straight to JSON with orjson.
+
+    Returning a Response skips FastAPI's response_model re-validation and
+    jsonable_encoder pass; the schema is still used for the OpenAPI docs.
+    Dates and datetimes are left as Python objects so orjson writes them
+    as ISO-8601 strings itself.
+
+    Args:
+        model: Response schema instance
+        exclude: Fields to leave out, in model_dump's exclude format
+
+    Returns:
+        ORJSONResponse with the serialized schema
+    """
+    return ORJSONResponse(model.model_dump(exclude=exclude))
 
 
 @router.post("/detect", response_model=FraudDetectionResponse, status_code=status.HTTP_200_OK)
@@ -36,6 +55,7 @@ def detect_fraud(
 
     - **claim_ids**: Optional list of specific claim IDs to analyze (if None, analyzes all claims)
     - **limit**: Optional maximum number of claims to analyze
+    - **offset**: Number of claims to skip before analyzing (default 0)
 
     Returns fraud predictions for each analyzed claim including:
     - Fraud probability (0-1)
@@ -55,22 +75,23 @@ def detect_fraud(
         if request.claim_ids:
             predictions = fraud_service.detect_fraud_by_claim_ids(request.claim_ids)
         else:
-            predictions = fraud_service.detect_fraud_all_claims(limit=request.limit)
+            predictions = fraud_service.detect_fraud_all_claims(limit=request.limit, offset=request.offset)
 
         # Calculate statistics
         total_analyzed = len(predictions)
         fraud_detected = sum(1 for p in predictions if p['is_fraud_predicted'])
         fraud_rate = fraud_detected / total_analyzed if total_analyzed > 0 else 0
 
-        # Convert to response model
-        fraud_predictions = [FraudPrediction(**p) for p in predictions]
+        # Convert to response model (service output is trusted, so skip validation)
+        fraud_predictions = [FraudPrediction.build_trusted(**p) for p in predictions]
 
-        return FraudDetectionResponse(
+        # Explanations are only returned by /detect-with-insights
+        return _json_response(FraudDetectionResponse.build_trusted(
             total_analyzed=total_analyzed,
             fraud_detected=fraud_detected,
             fraud_rate=fraud_rate,
             predictions=fraud_predictions
-        )
+        ), exclude={'predictions': {'__all__': {'explanation'}}})
 
     except Exception as e:
         raise HTTPException(
@@ -96,7 +117,7 @@ def get_fraud_statistics(current_user: User = Depends(get_current_user)):
         fraud_service = get_fraud_service()
         stats = fraud_service.get_fraud_statistics()
 
-        return FraudStatisticsResponse(**stats)
+        return _json_response(FraudStatisticsResponse.build_trusted(**stats))
 
     except Exception as e:
         raise HTTPException(
@@ -128,7 +149,7 @@ def get_model_performance(current_user: User = Depends(get_current_user)):
 
         performance = fraud_service.get_model_performance()
 
-        return ModelPerformanceResponse(**performance)
+        return _json_response(ModelPerformanceResponse.build_trusted(**performance))
 
     except Exception as e:
         raise HTTPException(
@@ -163,9 +184,8 @@ def get_feature_importance(
 
         importance_list = fraud_service.get_feature_importance(top_n=top_n)
 
-        features = [FeatureImportance(**item) for item in importance_list]
-
-        return FeatureImportanceResponse(features=features)
+        # Feature importance records are already {'feature', 'importance'} dicts
+        return _json_response(FeatureImportanceResponse.build_trusted(features=importance_list))
 
     except Exception as e:
         raise HTTPException(
@@ -214,6 +234,7 @@ def detect_fraud_with_insights(
 
     - **claim_ids**: Optional list of specific claim IDs to analyze (if None, analyzes all claims)
     - **limit**: Optional maximum number of claims to analyze
+    - **offset**: Number of claims to skip before analyzing (default 0)
 
     Returns comprehensive fraud analysis including AI-generated insights.
     """
@@ -229,27 +250,28 @@ def detect_fraud_with_insights(
         # Detect fraud with insights
         result = fraud_service.detect_fraud_with_insights(
             limit=request.limit,
-            claim_ids=request.claim_ids
+            claim_ids=request.claim_ids,
+            offset=request.offset
         )
 
-        # Convert predictions to response model
+        # Convert predictions to response model (service output is trusted, so skip validation)
         predictions_with_explanations = [
-            FraudPredictionWithExplanation(**p) for p in result['predictions']
+            FraudPrediction.build_trusted(**p) for p in result['predictions']
         ]
 
-        # Convert insights to response model
+        # Convert insights to response model (generated by OpenAI, so validate them)
         insights = None
         if result.get('insights'):
             insights = [FraudInsight(**ins) for ins in result['insights']]
 
-        return FraudDetectionWithInsightsResponse(
+        return _json_response(FraudDetectionWithInsightsResponse.build_trusted(
             total_analyzed=result['total_analyzed'],
             fraud_detected=result['fraud_detected'],
             executive_summary=result.get('executive_summary'),
             insights=insights,
             predictions=predictions_with_explanations,
-            statistics=result['statistics']
-        )
+            statistics=FraudStatisticsResponse.build_trusted(**result['statistics'])
+        ))
 
     except Exception as e:
         raise HTTPException(
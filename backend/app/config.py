@@ -16,11 +16,13 @@ class Settings(BaseSettings):
     # JWT Configuration
     jwt_secret_key: str = Field(..., alias="JWT_SECRET_KEY")
     jwt_algorithm: str = Field(default="HS256", alias="JWT_ALGORITHM")
+    jwt_backend: str = Field(default="pyjwt", alias="JWT_BACKEND")  # "pyjwt" or legacy "jose"
     access_token_expire_minutes: int = Field(default=30, alias="ACCESS_TOKEN_EXPIRE_MINUTES")
     refresh_token_expire_days: int = Field(default=7, alias="REFRESH_TOKEN_EXPIRE_DAYS")
 
     # Database Configuration
     database_url: str = Field(default="sqlite:///./data/auth.db", alias="DATABASE_URL")
+    db_pool_size: int = Field(default=20, alias="DB_POOL_SIZE")
     memgraph_host: str = Field(default="localhost", alias="MEMGRAPH_HOST")
     memgraph_port: int = Field(default=7687, alias="MEMGRAPH_PORT")
 
@@ -1,6 +1,7 @@
 """
 Fraud detection service for analyzing health insurance claims.
 """
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 import pandas as pd
 from app.db.memgraph_db import get_data_loader
@@ -10,6 +11,38 @@ from app.core.fraud_explainer_service import get_fraud_explainer
 import os
 
 
+def _to_service_dates(service_dates: pd.Series) -> pd.Series:
+    """
+    Parse ISO-8601 service dates into ``datetime.date`` objects.
+
+    Args:
+        service_dates: Raw service_date column
+
+    Returns:
+        Series of dates, with None where the value could not be parsed
+    """
+    parsed = pd.to_datetime(service_dates, format='ISO8601', errors='coerce')
+    return parsed.dt.date.astype(object).where(parsed.notna(), None)
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """
+    Parse an ISO-8601 timestamp stored in the model metadata.
+
+    Args:
+        value: Timestamp string (or datetime) from the training metadata
+
+    Returns:
+        datetime, or None if missing or unparseable
+    """
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
 class FraudDetectionService:
     """Service for detecting fraudulent health insurance claims."""
 
@@ -40,6 +73,9 @@ class FraudDetectionService:
             model_loaded = self.model.load('fraud_model')
 
             if model_loaded:
+                # Compile the ensemble for batched inference (falls back to sklearn)
+                self.model.compile_for_inference()
+
                 # Initialize feature extractor
                 self.feature_extractor = FraudFeatureExtractor(self.data_loader)
 
@@ -54,12 +90,13 @@ class FraudDetectionService:
         except Exception as e:
             print(f"⚠ Warning: Could not initialize fraud detection service: {e}")
 
-    def detect_fraud_all_claims(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def detect_fraud_all_claims(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
         """
         Detect fraud in all claims in the database.
 
         Args:
             limit: Maximum number of claims to analyze (None = all)
+            offset: Number of claims to skip before analyzing
 
         Returns:
             List of fraud predictions with risk assessments
@@ -67,11 +104,13 @@ class FraudDetectionService:
         if self.model is None or self.feature_extractor is None:
             raise ValueError("Model not loaded. Please train the model first.")
 
-        # Get all claims
-        claims_df = self.data_loader.claims_df.copy()
+        # Get the requested window of claims (copying only that window)
+        end = offset + limit if limit else None
+        claims_df = self.data_loader.claims_df.iloc[offset:end].copy()
 
-        if limit:
-            claims_df = claims_df.head(limit)
+        # An offset past the last claim leaves nothing to analyze
+        if len(claims_df) == 0:
+            return []
 
         # Extract features
         print(f"Analyzing {len(claims_df)} claims for fraud...")
@@ -91,6 +130,7 @@ class FraudDetectionService:
 
         # Add claim details to assessments
         # Drop duplicate claim_ids to ensure unique index
+        claims_df['service_date'] = _to_service_dates(claims_df['service_date'])
         claim_details = claims_df.drop_duplicates(subset='claim_id').set_index('claim_id').to_dict('index')
 
         for assessment in assessments:
@@ -101,7 +141,7 @@ class FraudDetectionService:
                     'patient_id': str(details.get('patient_id', '')),
                     'provider_id': str(details.get('provider_id', '')),
                     'claim_amount': float(details.get('claim_amount', 0)),
-                    'service_date': str(details.get('service_date', '')),
+                    'service_date': details.get('service_date'),
                     'claim_type': str(details.get('claim_type', '')),
                     'actual_fraud_label': bool(details.get('is_fraudulent', False)),
                     'actual_fraud_type': str(details.get('fraud_type', '')) if pd.notna(details.get('fraud_type')) else None
@@ -164,6 +204,7 @@ class FraudDetectionService:
 
         # Add claim details to assessments
         # Drop duplicate claim_ids to ensure unique index
+        claims_df['service_date'] = _to_service_dates(claims_df['service_date'])
         claim_details = claims_df.drop_duplicates(subset='claim_id').set_index('claim_id').to_dict('index')
 
         for assessment in assessments:
@@ -174,7 +215,7 @@ class FraudDetectionService:
                     'patient_id': str(details.get('patient_id', '')),
                     'provider_id': str(details.get('provider_id', '')),
                     'claim_amount': float(details.get('claim_amount', 0)),
-                    'service_date': str(details.get('service_date', '')),
+                    'service_date': details.get('service_date'),
                     'claim_type': str(details.get('claim_type', '')),
                     'actual_fraud_label': bool(details.get('is_fraudulent', False)),
                     'actual_fraud_type': str(details.get('fraud_type', '')) if pd.notna(details.get('fraud_type')) else None
@@ -216,7 +257,7 @@ class FraudDetectionService:
             model_info = self.model.get_training_info()
             if model_info:
                 stats['model_info'] = {
-                    'trained_at': model_info.get('trained_at'),
+                    'trained_at': _to_datetime(model_info.get('trained_at')),
                     'test_accuracy': model_info.get('metrics', {}).get('test', {}).get('accuracy'),
                     'test_f1': model_info.get('metrics', {}).get('test', {}).get('f1'),
                     'test_auc_roc': model_info.get('metrics', {}).get('test', {}).get('auc_roc'),
@@ -240,7 +281,7 @@ class FraudDetectionService:
             return {'error': 'No training information available'}
 
         return {
-            'trained_at': training_info.get('trained_at'),
+            'trained_at': _to_datetime(training_info.get('trained_at')),
             'num_features': training_info.get('num_features'),
             'num_training_samples': training_info.get('num_training_samples'),
             'num_test_samples': training_info.get('num_test_samples'),
@@ -267,13 +308,19 @@ class FraudDetectionService:
 
         return importance_df.head(top_n).to_dict('records')
 
-    def detect_fraud_with_insights(self, limit: Optional[int] = None, claim_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+    def detect_fraud_with_insights(
+        self,
+        limit: Optional[int] = None,
+        claim_ids: Optional[List[str]] = None,
+        offset: int = 0
+    ) -> Dict[str, Any]:
         """
         Detect fraud and generate OpenAI-powered insights.
 
         Args:
             limit: Maximum number of claims to analyze (for all claims)
             claim_ids: Specific claim IDs to analyze
+            offset: Number of claims to skip before analyzing (for all claims)
 
         Returns:
             Dictionary with predictions, executive_summary, insights, statistics
@@ -284,7 +331,7 @@ class FraudDetectionService:
         if claim_ids:
             assessments = self.detect_fraud_by_claim_ids(claim_ids)
         else:
-            assessments = self.detect_fraud_all_claims(limit)
+            assessments = self.detect_fraud_all_claims(limit, offset)
 
         # Get statistics
         statistics = self.get_fraud_statistics()
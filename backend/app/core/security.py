@@ -3,10 +3,16 @@ Security utilities for JWT token management and password hashing.
 """
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
-from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.config import settings
 
+# PyJWT signs/verifies faster than python-jose; jose is kept as a legacy fallback
+if settings.jwt_backend == "jose":
+    from jose import JWTError, jwt
+else:
+    import jwt
+    from jwt import InvalidTokenError as JWTError
+
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
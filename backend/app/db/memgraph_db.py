@@ -4,6 +4,7 @@ Provides in-memory graph-like operations on CSV data.
 """
 import pandas as pd
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 import networkx as nx
 
@@ -32,16 +33,23 @@ class CSVDataLoader:
         self.load_data()
 
     def load_data(self):
-        """Load all CSV files into pandas DataFrames."""
+        """Load all data files into pandas DataFrames."""
         try:
-            self.patients_df = pd.read_csv(f"{self.data_dir}/patients.csv")
-            self.providers_df = pd.read_csv(f"{self.data_dir}/providers.csv")
-            self.pharmacies_df = pd.read_csv(f"{self.data_dir}/pharmacies.csv")
-            self.policies_df = pd.read_csv(f"{self.data_dir}/policies.csv")
-            self.claims_df = pd.read_csv(f"{self.data_dir}/claims.csv")
-            self.diagnoses_df = pd.read_csv(f"{self.data_dir}/diagnoses.csv")
-            self.procedures_df = pd.read_csv(f"{self.data_dir}/procedures.csv")
-            self.medications_df = pd.read_csv(f"{self.data_dir}/medications.csv")
+            # The tables are independent, so they are read on parallel threads
+            # (the pandas and pyarrow readers release the GIL while parsing)
+            names = ["patients", "providers", "pharmacies", "policies",
+                     "claims", "diagnoses", "procedures", "medications"]
+            with ThreadPoolExecutor(max_workers=len(names)) as executor:
+                tables = dict(zip(names, executor.map(self._read_table, names)))
+
+            self.patients_df = tables["patients"]
+            self.providers_df = tables["providers"]
+            self.pharmacies_df = tables["pharmacies"]
+            self.policies_df = tables["policies"]
+            self.claims_df = tables["claims"]
+            self.diagnoses_df = tables["diagnoses"]
+            self.procedures_df = tables["procedures"]
+            self.medications_df = tables["medications"]
 
             # Build in-memory graph for relationship queries
             self._build_graph()
@@ -55,6 +63,37 @@ class CSVDataLoader:
             print(f"Warning: Could not load data files: {e}")
             print("Run: python dataset/health_data_generator.py 1000 5000 0.15")
 
+    def _read_table(self, name: str) -> pd.DataFrame:
+        """
+        Read a table, preferring a Feather copy, then a Parquet copy, over the CSV.
+
+        A copy is only used when it is at least as new as the CSV, so uploaded
+        CSVs are never shadowed by a stale conversion. The Feather (Arrow IPC)
+        copy is memory-mapped, so it loads without any parsing or decoding.
+
+        Args:
+            name: Table name (file name without extension)
+
+        Returns:
+            DataFrame with the table contents
+        """
+        csv_path = f"{self.data_dir}/{name}.csv"
+        csv_mtime = os.path.getmtime(csv_path) if os.path.exists(csv_path) else None
+
+        for ext in ("feather", "parquet"):
+            path = f"{self.data_dir}/{name}.{ext}"
+            if not os.path.exists(path) or (csv_mtime is not None and os.path.getmtime(path) < csv_mtime):
+                continue
+            try:
+                if ext == "feather":
+                    from pyarrow import feather
+                    return feather.read_table(path, memory_map=True).to_pandas()
+                return pd.read_parquet(path, engine="pyarrow", memory_map=True)
+            except ImportError:
+                break  # pyarrow not installed, fall back to CSV
+
+        return pd.read_csv(csv_path)
+
     def _build_graph(self):
         """Build NetworkX graph from relationships."""
         self.graph = nx.Graph()
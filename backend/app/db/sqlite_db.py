@@ -11,6 +11,8 @@ from app.config import settings
 engine = create_engine(
     settings.database_url,
     connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
+    pool_size=settings.db_pool_size,
+    pool_pre_ping=True,
     echo=settings.debug
 )
 
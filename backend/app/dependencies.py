@@ -40,7 +40,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    # Primary-key lookup goes through the session identity map before hitting SQL
+    user = db.get(User, int(user_id))
 
     if user is None:
         raise HTTPException(
@@ -36,6 +36,9 @@ async def startup_event():
     init_db()
     print("Database initialized successfully")
 
+    # Generate the OpenAPI schema now so the first /docs request doesn't pay for it
+    app.openapi()
+
 
 @app.get("/", tags=["health"])
 async def root():
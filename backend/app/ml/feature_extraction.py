@@ -2,14 +2,17 @@
 Graph-based feature extraction for fraud detection.
 Extracts features from patient, provider, claim relationships using CSV data and NetworkX.
 """
+import os
 import pandas as pd
 import networkx as nx
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 from datetime import datetime, timedelta
 from collections import Counter
-import warnings
-warnings.filterwarnings('ignore')
+from concurrent.futures import ThreadPoolExecutor
+
+# Bump whenever the extracted features change so cached training matrices are rebuilt
+FEATURE_VERSION = 1
 
 
 class FraudFeatureExtractor:
@@ -28,6 +31,15 @@ class FraudFeatureExtractor:
         self.claims_df = data_loader.claims_df
         self.graph = data_loader.graph
 
+        # Patient ages are parsed once; unparseable birth dates fall back to a default age
+        dob = pd.to_datetime(self.patients_df['date_of_birth'], format='ISO8601', errors='coerce')
+        ages = ((pd.Timestamp.now() - dob).dt.days / 365.25).fillna(45)
+        self._patient_age_map = dict(zip(self.patients_df['patient_id'], ages))
+
+        # Per-patient service date range over all claims, used by the temporal features
+        all_service_dates = pd.to_datetime(self.claims_df['service_date'], format='ISO8601')
+        self._patient_date_stats = all_service_dates.groupby(self.claims_df['patient_id']).agg(['min', 'max', 'size'])
+
     def extract_all_features(self, claim_ids: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Extract all features for claims.
@@ -38,38 +50,38 @@ class FraudFeatureExtractor:
         Returns:
             DataFrame with features for each claim
         """
+        # No copy needed: the feature helpers only read from claims_subset
         if claim_ids is None:
-            claims_subset = self.claims_df.copy()
+            claims_subset = self.claims_df
         else:
-            claims_subset = self.claims_df[self.claims_df['claim_id'].isin(claim_ids)].copy()
-
-        print(f"Extracting features for {len(claims_subset)} claims...")
-
-        # Extract different feature groups
-        print("  - Extracting claim features...")
-        claim_features = self._extract_claim_features(claims_subset)
+            claims_subset = self.claims_df[self.claims_df['claim_id'].isin(claim_ids)]
 
-        print("  - Extracting patient features...")
-        patient_features = self._extract_patient_features(claims_subset)
+        # Nothing to extract; the feature joins need at least one claim
+        if len(claims_subset) == 0:
+            return claims_subset[['claim_id']].reset_index(drop=True)
 
-        print("  - Extracting provider features...")
-        provider_features = self._extract_provider_features(claims_subset)
-
-        print("  - Extracting temporal features...")
-        temporal_features = self._extract_temporal_features(claims_subset)
+        print(f"Extracting features for {len(claims_subset)} claims...")
 
-        print("  - Extracting graph features...")
-        graph_features = self._extract_graph_features(claims_subset)
+        # Extract the independent feature groups concurrently; the helpers only
+        # read shared state and most of their work runs in GIL-releasing pandas kernels
+        print("  - Extracting claim, patient, provider, temporal and graph features...")
+        feature_groups = [
+            self._extract_claim_features,
+            self._extract_patient_features,
+            self._extract_provider_features,
+            self._extract_temporal_features,
+            self._extract_graph_features,
+        ]
+        with ThreadPoolExecutor(max_workers=len(feature_groups)) as executor:
+            futures = [executor.submit(extract, claims_subset) for extract in feature_groups]
+            group_features = [future.result() for future in futures]
 
         # Combine all features
-        features = pd.concat([
-            claims_subset[['claim_id']].reset_index(drop=True),
-            claim_features.reset_index(drop=True),
-            patient_features.reset_index(drop=True),
-            provider_features.reset_index(drop=True),
-            temporal_features.reset_index(drop=True),
-            graph_features.reset_index(drop=True)
-        ], axis=1)
+        features = pd.concat(
+            [claims_subset[['claim_id']].reset_index(drop=True)]
+            + [group.reset_index(drop=True) for group in group_features],
+            axis=1
+        )
 
         print(f"✓ Extracted {len(features.columns)-1} features for {len(features)} claims")
 
@@ -107,8 +119,6 @@ class FraudFeatureExtractor:
 
     def _extract_patient_features(self, claims_df: pd.DataFrame) -> pd.DataFrame:
         """Extract features about patients."""
-        features = pd.DataFrame()
-
         # Get patient data for each claim
         patient_ids = claims_df['patient_id'].unique()
 
@@ -127,22 +137,13 @@ class FraudFeatureExtractor:
                 'patient_num_providers': patient_claims['provider_id'].nunique(),
             }
 
-        # Map back to claims
-        for col in patient_stats[patient_ids[0]].keys():
-            features[col] = claims_df['patient_id'].map(lambda x: patient_stats.get(x, {}).get(col, 0))
+        # Broadcast back to claims with a single join on patient_id
+        patient_stats_df = pd.DataFrame.from_dict(patient_stats, orient='index')
+        features = claims_df[['patient_id']].join(patient_stats_df, on='patient_id').drop(columns='patient_id')
 
         # Patient age (calculate from date_of_birth if available)
         if 'patient_id' in claims_df.columns:
-            patient_ages = {}
-            for _, patient in self.patients_df.iterrows():
-                try:
-                    dob = pd.to_datetime(patient['date_of_birth'])
-                    age = (datetime.now() - dob).days / 365.25
-                    patient_ages[patient['patient_id']] = age
-                except:
-                    patient_ages[patient['patient_id']] = 45  # Default age
-
-            features['patient_age'] = claims_df['patient_id'].map(patient_ages)
+            features['patient_age'] = claims_df['patient_id'].map(self._patient_age_map)
 
         # Patient gender encoding
         patient_gender = self.patients_df.set_index('patient_id')['gender'].to_dict()
@@ -154,8 +155,6 @@ class FraudFeatureExtractor:
 
     def _extract_provider_features(self, claims_df: pd.DataFrame) -> pd.DataFrame:
         """Extract features about providers."""
-        features = pd.DataFrame()
-
         # Get provider data for each claim
         provider_ids = claims_df['provider_id'].unique()
 
@@ -174,9 +173,9 @@ class FraudFeatureExtractor:
                 'provider_fraud_rate': provider_claims['is_fraudulent'].mean() if 'is_fraudulent' in provider_claims else 0,
             }
 
-        # Map back to claims
-        for col in provider_stats[provider_ids[0]].keys():
-            features[col] = claims_df['provider_id'].map(lambda x: provider_stats.get(x, {}).get(col, 0))
+        # Broadcast back to claims with a single join on provider_id
+        provider_stats_df = pd.DataFrame.from_dict(provider_stats, orient='index')
+        features = claims_df[['provider_id']].join(provider_stats_df, on='provider_id').drop(columns='provider_id')
 
         # Provider specialty encoding - ensure consistent columns
         provider_specialty = self.providers_df.set_index('provider_id')['specialty'].to_dict()
@@ -212,28 +211,13 @@ class FraudFeatureExtractor:
         features['is_night'] = ((service_dates.dt.hour < 6) | (service_dates.dt.hour > 20)).astype(int)
 
         # Days since first claim for each patient
-        patient_first_claim = {}
-        for patient_id in claims_df['patient_id'].unique():
-            patient_claims = self.claims_df[self.claims_df['patient_id'] == patient_id]
-            first_claim_date = pd.to_datetime(patient_claims['service_date'], format='ISO8601').min()
-            patient_first_claim[patient_id] = first_claim_date
-
-        features['days_since_first_claim'] = claims_df.apply(
-            lambda row: (pd.to_datetime(row['service_date'], format='ISO8601') - patient_first_claim.get(row['patient_id'], pd.to_datetime(row['service_date'], format='ISO8601'))).days,
-            axis=1
-        )
-
-        # Claim frequency (claims per day for patient)
-        claim_frequency = {}
-        for patient_id in claims_df['patient_id'].unique():
-            patient_claims = self.claims_df[self.claims_df['patient_id'] == patient_id]
-            dates = pd.to_datetime(patient_claims['service_date'], format='ISO8601')
-            if len(dates) > 1:
-                date_range = (dates.max() - dates.min()).days + 1
-                claim_frequency[patient_id] = len(patient_claims) / max(date_range, 1)
-            else:
-                claim_frequency[patient_id] = 0
+        date_stats = self._patient_date_stats
+        first_claim_dates = claims_df['patient_id'].map(date_stats['min'])
+        features['days_since_first_claim'] = (service_dates - first_claim_dates).dt.days
 
+        # Claim frequency (claims per day for patient, 0 for single-claim patients)
+        date_range = ((date_stats['max'] - date_stats['min']).dt.days + 1).clip(lower=1)
+        claim_frequency = (date_stats['size'] / date_range).where(date_stats['size'] > 1, 0)
         features['patient_claim_frequency'] = claims_df['patient_id'].map(claim_frequency)
 
         return features
@@ -321,15 +305,28 @@ class FraudFeatureExtractor:
 
         return features
 
-    def prepare_training_data(self) -> Tuple[pd.DataFrame, pd.Series]:
+    def prepare_training_data(self, cache_path: Optional[str] = None) -> Tuple[pd.DataFrame, pd.Series]:
         """
         Prepare feature matrix and labels for training.
 
+        Args:
+            cache_path: Optional Parquet file caching the matrix between training runs.
+                It is reused only while it is newer than the claims, patients and providers data.
+
         Returns:
             Tuple of (features_df, labels_series)
         """
         print("\n📊 Preparing training data...")
 
+        if cache_path and self._is_cache_fresh(cache_path):
+            try:
+                cached = pd.read_parquet(cache_path, engine="pyarrow")
+                labels = cached.pop('is_fraudulent')
+                print(f"✓ Loaded {cached.shape[0]} samples with {cached.shape[1]} features from {cache_path}")
+                return cached, labels
+            except ImportError:
+                pass  # pyarrow not installed, extract features instead
+
         # Extract features for all claims
         features_df = self.extract_all_features()
 
@@ -350,12 +347,38 @@ class FraudFeatureExtractor:
         # Handle infinite values
         features_df = features_df.replace([np.inf, -np.inf], 0)
 
+        if cache_path:
+            try:
+                features_df.assign(is_fraudulent=labels.to_numpy()).to_parquet(
+                    cache_path, engine="pyarrow", compression="zstd", index=False
+                )
+            except ImportError:
+                pass  # pyarrow not installed, skip caching
+
         print(f"✓ Prepared {features_df.shape[0]} samples with {features_df.shape[1]} features")
         print(f"  - Fraudulent claims: {labels.sum()} ({labels.mean()*100:.1f}%)")
         print(f"  - Normal claims: {(~labels).sum()} ({(~labels).mean()*100:.1f}%)")
 
         return features_df, labels
 
+    def _is_cache_fresh(self, cache_path: str) -> bool:
+        """Check that a cached feature matrix is newer than the data it was built from."""
+        if not os.path.exists(cache_path):
+            return False
+
+        data_dir = getattr(self.data_loader, 'data_dir', None)
+        if data_dir is None:
+            return False
+
+        cache_mtime = os.path.getmtime(cache_path)
+        for name in ('claims', 'patients', 'providers'):
+            for ext in ('csv', 'parquet', 'feather'):
+                source = os.path.join(data_dir, f"{name}.{ext}")
+                if os.path.exists(source) and os.path.getmtime(source) > cache_mtime:
+                    return False
+
+        return True
+
     def get_feature_names(self) -> List[str]:
         """Get list of all feature names."""
         # Extract features for a single claim to get feature names
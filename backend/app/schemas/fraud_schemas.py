@@ -1,38 +1,110 @@
 """
 Pydantic schemas for fraud detection API.
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional, Dict
+from typing_extensions import Annotated, TypedDict
+from datetime import date, datetime
 
 
-class FraudRiskFactor(BaseModel):
+# Shared constrained types, declared once and reused by every schema
+Probability = Annotated[float, Field(ge=0, le=1)]
+
+
+class TrustedModel(BaseModel):
+    """Base for response schemas built from data the backend produced itself."""
+
+    # Responses are immutable once built; unknown keys from service dicts are dropped
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
+    @classmethod
+    def build_trusted(cls, **data):
+        """
+        Build an instance without running validation.
+
+        Only for trusted server-side data (ML output, database rows). Nested
+        schema fields must already hold model instances, since
+        model_construct does not recurse.
+
+        Args:
+            **data: Field values
+
+        Returns:
+            Model instance
+        """
+        return cls.model_construct(**data)
+
+
+# Leaf entries of large lists are plain dicts (TypedDict) rather than models
+class FraudRiskFactor(TypedDict):
     """Risk factor contributing to fraud prediction."""
-    factor: str = Field(..., description="Name of the risk factor")
-    value: float = Field(..., description="Value of the risk factor")
+    factor: Annotated[str, Field(description="Name of the risk factor")]
+    value: Annotated[float, Field(description="Value of the risk factor")]
+
+
+class RedFlag(TypedDict):
+    """Red flag raised by the fraud explainer."""
+    id: Annotated[int, Field(description="Position of the triggering risk factor")]
+    category: Annotated[str, Field(description="Red flag category")]
+    severity: Annotated[str, Field(description="Severity: CRITICAL, HIGH, MEDIUM, LOW")]
+    description: Annotated[str, Field(description="Red flag description")]
+    data_points: Annotated[List[str], Field(description="Supporting data points")]
 
 
-class FraudPrediction(BaseModel):
+class FraudExplanation(TrustedModel):
+    """Detailed fraud explanation for a claim."""
+    summary: str = Field(..., description="Summary explanation")
+    red_flags: List[RedFlag] = Field(..., description="Red flags identified")
+    recommendation: str = Field(..., description="Recommended action")
+    confidence_explanation: str = Field(..., description="Confidence explanation")
+    total_red_flags: int = Field(..., description="Total number of red flags")
+    risk_score: float = Field(..., description="Risk score")
+
+
+class FraudPrediction(TrustedModel):
     """Fraud prediction for a single claim."""
     claim_id: str = Field(..., description="Unique claim identifier")
     patient_id: Optional[str] = Field(None, description="Patient ID")
     provider_id: Optional[str] = Field(None, description="Provider ID")
     claim_amount: Optional[float] = Field(None, description="Claim amount")
-    service_date: Optional[str] = Field(None, description="Service date")
+    service_date: Optional[date] = Field(None, description="Service date")
     claim_type: Optional[str] = Field(None, description="Type of claim")
 
     is_fraud_predicted: bool = Field(..., description="Whether fraud is predicted")
-    fraud_probability: float = Field(..., ge=0, le=1, description="Probability of fraud (0-1)")
+    fraud_probability: Probability = Field(..., description="Probability of fraud (0-1)")
     risk_level: str = Field(..., description="Risk level: MINIMAL, LOW, MEDIUM, HIGH, CRITICAL")
-    confidence: float = Field(..., ge=0, le=1, description="Confidence in prediction")
+    confidence: Probability = Field(..., description="Confidence in prediction")
 
     risk_factors: List[FraudRiskFactor] = Field(default_factory=list, description="Top risk factors")
 
     actual_fraud_label: Optional[bool] = Field(None, description="Actual fraud label (if available)")
     actual_fraud_type: Optional[str] = Field(None, description="Actual fraud type (if available)")
 
-    class Config:
-        json_schema_extra = {
+    # Only set by /detect-with-insights; /detect leaves it out of the response
+    explanation: Optional[FraudExplanation] = Field(None, description="Detailed fraud explanation")
+
+    @classmethod
+    def build_trusted(cls, **data):
+        """
+        Build a prediction, and its explanation if present, from service output.
+
+        One instance is built per claim, so this calls model_construct directly
+        rather than through TrustedModel.build_trusted, which would unpack and
+        repack the keyword arguments a second time.
+
+        Args:
+            **data: Assessment dict from the fraud detection service
+
+        Returns:
+            FraudPrediction instance
+        """
+        explanation = data.get('explanation')
+        if explanation is not None:
+            data['explanation'] = FraudExplanation.model_construct(**explanation)
+        return cls.model_construct(**data)
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "claim_id": "CLM123456",
                 "patient_id": "PAT000123",
@@ -52,31 +124,36 @@ class FraudPrediction(BaseModel):
                 "actual_fraud_type": "upcoding"
             }
         }
+    )
 
 
 class FraudDetectionRequest(BaseModel):
     """Request to detect fraud in claims."""
     claim_ids: Optional[List[str]] = Field(None, description="List of claim IDs to analyze (None = all claims)")
     limit: Optional[int] = Field(None, ge=1, le=10000, description="Maximum number of claims to analyze")
+    offset: int = Field(0, ge=0, description="Number of claims to skip before analyzing (ignored with claim_ids)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra='ignore',
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "claim_ids": ["CLM123456", "CLM123457"],
                 "limit": 100
             }
         }
+    )
 
 
-class FraudDetectionResponse(BaseModel):
+class FraudDetectionResponse(TrustedModel):
     """Response from fraud detection."""
     total_analyzed: int = Field(..., description="Total number of claims analyzed")
     fraud_detected: int = Field(..., description="Number of claims flagged as fraud")
-    fraud_rate: float = Field(..., ge=0, le=1, description="Percentage of claims flagged as fraud")
+    fraud_rate: Probability = Field(..., description="Percentage of claims flagged as fraud")
     predictions: List[FraudPrediction] = Field(..., description="List of fraud predictions")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_analyzed": 100,
                 "fraud_detected": 15,
@@ -91,19 +168,44 @@ class FraudDetectionResponse(BaseModel):
                 ]
             }
         }
+    )
+
+
+class ModelInfo(TypedDict, total=False):
+    """Summary of the trained model attached to fraud statistics."""
+    trained_at: Optional[datetime]
+    test_accuracy: Optional[float]
+    test_f1: Optional[float]
+    test_auc_roc: Optional[float]
+
+
+class SplitMetrics(TypedDict, total=False):
+    """Classification metrics for one data split."""
+    accuracy: float
+    precision: float
+    recall: float
+    f1: float
+    auc_roc: float
+    confusion_matrix: List[List[int]]  # Test split only
+
+
+class ModelMetrics(TypedDict, total=False):
+    """Metrics for the train and test splits."""
+    train: SplitMetrics
+    test: SplitMetrics
 
 
-class FraudStatisticsResponse(BaseModel):
+class FraudStatisticsResponse(TrustedModel):
     """Response with fraud statistics."""
     total_claims: int = Field(..., description="Total number of claims")
     fraudulent_claims: int = Field(..., description="Number of fraudulent claims")
     normal_claims: int = Field(..., description="Number of normal claims")
-    fraud_rate: float = Field(..., ge=0, le=1, description="Fraud rate")
+    fraud_rate: Probability = Field(..., description="Fraud rate")
     fraud_by_type: Dict[str, int] = Field(..., description="Fraud counts by type")
-    model_info: Optional[Dict[str, Any]] = Field(None, description="Model information")
+    model_info: Optional[ModelInfo] = Field(None, description="Model information")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_claims": 5000,
                 "fraudulent_claims": 750,
@@ -120,21 +222,22 @@ class FraudStatisticsResponse(BaseModel):
                 }
             }
         }
+    )
 
 
-class ModelPerformanceResponse(BaseModel):
+class ModelPerformanceResponse(TrustedModel):
     """Response with model performance metrics."""
-    trained_at: Optional[str] = Field(None, description="When the model was trained")
+    trained_at: Optional[datetime] = Field(None, description="When the model was trained")
     num_features: Optional[int] = Field(None, description="Number of features used")
     num_training_samples: Optional[int] = Field(None, description="Number of training samples")
     num_test_samples: Optional[int] = Field(None, description="Number of test samples")
     fraud_rate_train: Optional[float] = Field(None, description="Fraud rate in training set")
     fraud_rate_test: Optional[float] = Field(None, description="Fraud rate in test set")
     used_smote: Optional[bool] = Field(None, description="Whether SMOTE was used")
-    metrics: Optional[Dict[str, Any]] = Field(None, description="Performance metrics")
+    metrics: Optional[ModelMetrics] = Field(None, description="Performance metrics")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "trained_at": "2024-01-15T10:30:00",
                 "num_features": 48,
@@ -159,20 +262,21 @@ class ModelPerformanceResponse(BaseModel):
                 }
             }
         }
+    )
 
 
-class FeatureImportance(BaseModel):
+class FeatureImportance(TypedDict):
     """Feature importance score."""
-    feature: str = Field(..., description="Feature name")
-    importance: float = Field(..., description="Importance score")
+    feature: Annotated[str, Field(description="Feature name")]
+    importance: Annotated[float, Field(description="Importance score")]
 
 
-class FeatureImportanceResponse(BaseModel):
+class FeatureImportanceResponse(TrustedModel):
     """Response with feature importance."""
     features: List[FeatureImportance] = Field(..., description="List of features with importance scores")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "features": [
                     {"feature": "claim_amount", "importance": 0.1357},
@@ -180,6 +284,7 @@ class FeatureImportanceResponse(BaseModel):
                 ]
             }
         }
+    )
 
 
 class FraudInsight(BaseModel):
@@ -189,33 +294,20 @@ class FraudInsight(BaseModel):
     impact: str = Field(..., description="Impact level: High, Medium, Low")
     action: str = Field(..., description="Recommended action")
 
-
-class FraudExplanation(BaseModel):
-    """Detailed fraud explanation for a claim."""
-    summary: str = Field(..., description="Summary explanation")
-    red_flags: List[Dict[str, Any]] = Field(..., description="Red flags identified")
-    recommendation: str = Field(..., description="Recommended action")
-    confidence_explanation: str = Field(..., description="Confidence explanation")
-    total_red_flags: int = Field(..., description="Total number of red flags")
-    risk_score: float = Field(..., description="Risk score")
-
-
-class FraudPredictionWithExplanation(FraudPrediction):
-    """Fraud prediction with detailed explanation."""
-    explanation: Optional[FraudExplanation] = Field(None, description="Detailed fraud explanation")
+    model_config = ConfigDict(extra='ignore', frozen=True)
 
 
-class FraudDetectionWithInsightsResponse(BaseModel):
+class FraudDetectionWithInsightsResponse(TrustedModel):
     """Response from fraud detection with AI-powered insights."""
     total_analyzed: int = Field(..., description="Total number of claims analyzed")
     fraud_detected: int = Field(..., description="Number of claims flagged as fraud")
     executive_summary: Optional[str] = Field(None, description="OpenAI-generated executive summary")
     insights: Optional[List[FraudInsight]] = Field(None, description="OpenAI-generated dynamic insights")
-    predictions: List[FraudPredictionWithExplanation] = Field(..., description="List of fraud predictions with explanations")
-    statistics: Dict[str, Any] = Field(..., description="Fraud statistics")
+    predictions: List[FraudPrediction] = Field(..., description="List of fraud predictions with explanations")
+    statistics: FraudStatisticsResponse = Field(..., description="Fraud statistics")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_analyzed": 100,
                 "fraud_detected": 15,
@@ -232,3 +324,4 @@ class FraudDetectionWithInsightsResponse(BaseModel):
                 "statistics": {}
             }
         }
+    )
@@ -9,22 +9,26 @@ Generates realistic synthetic health insurance data including:
 - Deliberate fraud patterns for ML training
 
 Usage:
-    python health_data_generator.py <num_patients> <num_claims> [fraud_rate]
+    python health_data_generator.py <num_patients> <num_claims> [fraud_rate] [--compress]
 
 Example:
     python health_data_generator.py 10000 50000 0.15
     # Generates 10,000 patients, 50,000 claims with 15% fraud rate
+
+    --compress writes metadata.json.zst (zstd) instead of metadata.json
 """
 
+import hashlib
 import random
 import sys
 import os
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from faker import Faker
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Tuple, Optional
-import json
+import orjson
 
 # Import medical reference data
 from medical_codes import (
@@ -37,17 +41,275 @@ from medical_codes import (
     FRAUD_PATTERNS,
     is_appropriate_combination,
     get_typical_cost,
+    get_typical_costs_batch,
 )
 from provider_data import (
-    generate_npi_number,
-    generate_license_number,
-    generate_provider_name,
+    generate_npi_batch,
+    generate_license_batch,
+    generate_provider_names,
 )
 
-# Initialize Faker
-fake = Faker()
-random.seed(42)  # For reproducibility
-np.random.seed(42)
+random.seed(42)  # For reproducibility of the provider_data helpers
+
+# Claim amounts are held as integer cents and only converted to dollars on output
+CLAIM_AMOUNT_COLUMNS = ['claim_amount', 'allowed_amount', 'paid_amount', 'patient_responsibility']
+
+# Compact dtypes for the columnar claims table: amounts in cents fit in int32,
+# and the code/category columns have few distinct values
+CLAIM_DTYPES = {
+    'claim_amount': 'int32',
+    'allowed_amount': 'int32',
+    'paid_amount': 'int32',
+    'patient_responsibility': 'int32',
+    'patient_id': 'category',
+    'policy_id': 'category',
+    'provider_id': 'category',
+    'diagnosis_code': 'category',
+    'procedure_code': 'category',
+    'claim_status': 'category',
+    'claim_type': 'category',
+    'fraud_type': 'category',
+}
+CLAIM_DATE_COLUMNS = ['submission_date', 'service_date']
+
+# Chronic conditions in bit order, and the condition list for every bitmask
+CHRONIC_CONDITIONS = ('hypertension', 'diabetes', 'heart_disease', 'asthma')
+CHRONIC_CONDITION_SETS = [
+    tuple(name for bit, name in enumerate(CHRONIC_CONDITIONS) if mask >> bit & 1)
+    for mask in range(1 << len(CHRONIC_CONDITIONS))
+]
+
+# Patients per worker process when generating Faker text fields
+PATIENTS_PER_WORKER = 5000
+
+# Faker street names, cities and states generated once and sampled for every address
+ADDRESS_POOL_SIZE = 5000
+
+EMAIL_DOMAINS = np.array(['example.com', 'example.org', 'example.net'])
+
+# Claims per Parquet row group (and per batch handed to the writer)
+PARQUET_ROW_GROUP_SIZE = 100_000
+
+# Claims generated and written at a time when streaming claims to disk
+CLAIMS_PER_CHUNK = 100_000
+
+
+def _fake_patient_names(genders: np.ndarray, seed: int) -> Dict[str, List[str]]:
+    """
+    Generate the Faker name fields for a chunk of patients.
+
+    Runs in a worker process, so it uses its own seeded Faker instance.
+
+    Args:
+        genders: Gender of each patient in the chunk
+        seed: Seed for this chunk's Faker instance
+
+    Returns:
+        first_name and last_name per patient
+    """
+    chunk_fake = Faker()
+    chunk_fake.seed_instance(seed)
+    return {
+        'first_name': [chunk_fake.first_name_male() if gender == 'M' else chunk_fake.first_name_female()
+                       for gender in genders],
+        'last_name': [chunk_fake.last_name() for _ in range(len(genders))],
+    }
+
+
+def _fake_address_pool(size: int, seed: int) -> pd.DataFrame:
+    """
+    Generate a pool of Faker street names, cities and states.
+
+    Args:
+        size: Number of entries in the pool
+        seed: Seed for the pool's Faker instance
+
+    Returns:
+        DataFrame with street_name, city and state columns
+    """
+    pool_fake = Faker()
+    pool_fake.seed_instance(seed)
+    return pd.DataFrame({
+        'street_name': [pool_fake.street_name() for _ in range(size)],
+        'city': [pool_fake.city() for _ in range(size)],
+        'state': [pool_fake.state_abbr() for _ in range(size)],
+    })
+
+
+def _random_phone_numbers(rng: np.random.Generator, n: int) -> List[str]:
+    """Generate n US phone numbers formatted as (XXX) XXX-XXXX."""
+    area_codes = rng.integers(200, 1000, n).tolist()
+    exchanges = rng.integers(200, 1000, n).tolist()
+    lines = rng.integers(0, 10000, n).tolist()
+    return [f"({a}) {e}-{line:04d}" for a, e, line in zip(area_codes, exchanges, lines)]
+
+
+def _random_zip_codes(rng: np.random.Generator, n: int) -> List[str]:
+    """Generate n five-digit ZIP codes."""
+    return [str(z) for z in rng.integers(10000, 100000, n).tolist()]
+
+
+def _random_cents(rng: np.random.Generator, low_dollars, high_dollars, size: Optional[int] = None) -> np.ndarray:
+    """Draw uniform amounts in integer cents between low_dollars and high_dollars (inclusive)."""
+    low = np.rint(np.multiply(low_dollars, 100)).astype(np.int64)
+    high = np.rint(np.multiply(high_dollars, 100)).astype(np.int64)
+    return rng.integers(low, high + 1, size)
+
+
+def _random_sha256_hashes(rng: np.random.Generator, n: int) -> List[str]:
+    """Generate n SHA-256 hex digests of random bytes."""
+    raw = rng.bytes(32 * n)
+    return [hashlib.sha256(raw[i:i + 32]).hexdigest() for i in range(0, 32 * n, 32)]
+
+
+def _random_emails(rng: np.random.Generator, first_names: List[str], last_names: List[str]) -> List[str]:
+    """Generate one email address per (first name, last name) pair."""
+    numbers = rng.integers(1, 100, len(first_names)).tolist()
+    domains = rng.choice(EMAIL_DOMAINS, len(first_names)).tolist()
+    return [
+        f"{first.lower()}.{last.lower()}{number}@{domain}"
+        for first, last, number, domain in zip(first_names, last_names, numbers, domains)
+    ]
+
+
+def _claims_in_dollars(claims: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert claim amounts from integer cents to dollars for output.
+
+    Args:
+        claims: Claims with amounts in cents
+
+    Returns:
+        Copy of the claims with float64 dollar amounts
+    """
+    claims = claims.copy()
+    for col in CLAIM_AMOUNT_COLUMNS:
+        if col in claims.columns:
+            claims[col] = claims[col] / 100
+    return claims
+
+
+def _as_read_from_csv(table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert a table to the values and types pandas reads back from its CSV file.
+
+    Args:
+        table: Generated table
+
+    Returns:
+        Copy of the table with plain object categories, string dates and list
+        columns, and numeric-looking ID/code columns as numbers
+    """
+    table = table.copy()
+    for col in table.columns:
+        values = table[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(object)
+        elif pd.api.types.is_datetime64_any_dtype(values):
+            values = values.dt.strftime('%Y-%m-%d')
+        elif len(values) and isinstance(values.iloc[0], list):
+            values = values.map(str)
+
+        # Numeric-looking ID/code columns are read back from the CSV as numbers
+        if not pd.api.types.is_numeric_dtype(values):
+            numeric = pd.to_numeric(values, errors='coerce')
+            if numeric.notna().any() and numeric.notna().equals(values.notna()):
+                values = numeric
+        table[col] = values
+    return table
+
+
+def _write_arrow_csv(arrow_table, destination, include_header: bool = True):
+    """
+    Write an Arrow table as CSV, with booleans spelled True/False as pandas writes them.
+
+    pyarrow writes booleans as lowercase true/false; only the CSV copy is
+    converted, the Parquet and Feather copies keep the boolean type.
+
+    Args:
+        arrow_table: Table to write
+        destination: File path or open binary file
+        include_header: Whether to write the header row
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+
+    for i, field in enumerate(arrow_table.schema):
+        if pa.types.is_boolean(field.type):
+            column = pc.if_else(arrow_table.column(i), "True", "False")
+            arrow_table = arrow_table.set_column(i, field.name, column)
+    pa_csv.write_csv(arrow_table, destination, pa_csv.WriteOptions(include_header=include_header))
+
+
+class ClaimChunkWriter:
+    """Appends chunks of claims to claims.csv, claims.parquet and claims.feather in an output directory."""
+
+    def __init__(self, output_dir: str):
+        """
+        Initialize the writer; the first chunk replaces any existing claims.csv.
+
+        Args:
+            output_dir: Directory to write the claim files to
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        self.csv_path = f"{output_dir}/claims.csv"
+        self.parquet_path = f"{output_dir}/claims.parquet"
+        self.feather_path = f"{output_dir}/claims.feather"
+        self.num_claims = 0
+        self.num_fraud_claims = 0
+        self._parquet_writer = None
+        self._feather_writer = None
+
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            self._pa, self._pq = pa, pq
+        except ImportError:
+            print("   ⚠️  pyarrow not installed, writing claims.csv with pandas and skipping claims.parquet/claims.feather")
+            self._pa = self._pq = None
+
+    def write(self, claims: pd.DataFrame):
+        """
+        Append a chunk of claims to all files.
+
+        Args:
+            claims: Compacted claims chunk
+        """
+        first_chunk = self.num_claims == 0
+        table = _as_read_from_csv(_claims_in_dollars(claims))
+
+        if self._pa is None:
+            table.to_csv(self.csv_path, mode='w' if first_chunk else 'a', header=first_chunk, index=False)
+        else:
+            # One Arrow table feeds the multi-threaded CSV writer, the Parquet file and the Feather file
+            schema = self._parquet_writer.schema if self._parquet_writer is not None else None
+            arrow_table = self._pa.Table.from_pandas(table, schema=schema, preserve_index=False)
+            with open(self.csv_path, 'wb' if first_chunk else 'ab') as f:
+                _write_arrow_csv(arrow_table, f, include_header=first_chunk)
+
+            if self._parquet_writer is None:
+                self._parquet_writer = self._pq.ParquetWriter(
+                    self.parquet_path, arrow_table.schema, compression='zstd', use_dictionary=True
+                )
+            self._parquet_writer.write_table(arrow_table, row_group_size=PARQUET_ROW_GROUP_SIZE)
+
+            if self._feather_writer is None:
+                # Uncompressed Arrow IPC (Feather v2), so readers can memory-map it without decoding
+                self._feather_writer = self._pa.ipc.new_file(self.feather_path, arrow_table.schema)
+            self._feather_writer.write_table(arrow_table, max_chunksize=PARQUET_ROW_GROUP_SIZE)
+
+        self.num_claims += len(claims)
+        self.num_fraud_claims += int(claims['is_fraudulent'].sum())
+
+    def close(self):
+        """Finish the Parquet and Feather files (after the CSV, so the loader picks them up)."""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        if self._feather_writer is not None:
+            self._feather_writer.close()
+            self._feather_writer = None
 
 
 class HealthInsuranceDataGenerator:
@@ -61,7 +323,9 @@ class HealthInsuranceDataGenerator:
         num_claims: int = 50000,
         fraud_rate: float = 0.15,
         start_date: str = "2023-01-01",
-        end_date: str = "2024-12-31"
+        end_date: str = "2024-12-31",
+        seed: int = 42,
+        n_jobs: Optional[int] = None
     ):
         """
         Initialize the data generator.
@@ -72,28 +336,87 @@ class HealthInsuranceDataGenerator:
             fraud_rate: Percentage of claims that should be fraudulent (0.0 to 1.0)
             start_date: Start date for claim generation
             end_date: End date for claim generation
+            seed: Seed for the generator's random number generator
+            n_jobs: Worker processes for patient names (None = all cores); does not affect the output
         """
         self.num_patients = num_patients
+        self.n_jobs = n_jobs or os.cpu_count() or 1
         self.num_claims = num_claims
         self.fraud_rate = fraud_rate
         self.start_date = datetime.strptime(start_date, "%Y-%m-%d")
         self.end_date = datetime.strptime(end_date, "%Y-%m-%d")
+        self._date_span_days = (self.end_date - self.start_date).days
+
+        # Single seeded PCG64 generator for all random draws
+        self.rng = np.random.default_rng(seed)
+        self._address_pool = _fake_address_pool(ADDRESS_POOL_SIZE, int(self.rng.integers(0, 2**31 - 1)))
 
         # Calculate derived numbers
         self.num_providers = max(int(num_patients * 0.05), 100)  # 5% of patients, min 100
         self.num_pharmacies = max(int(num_patients * 0.01), 50)  # 1% of patients, min 50
         self.num_policies = int(num_patients * 1.2)  # Some patients have multiple policies
 
-        # Storage for generated data
-        self.patients = []
-        self.providers = []
-        self.pharmacies = []
-        self.policies = []
-        self.claims = []
+        # Storage for generated data, columnar: one row per entity
+        self.patients = pd.DataFrame()
+        self.providers = pd.DataFrame()
+        self.pharmacies = pd.DataFrame()
+        self.policies = pd.DataFrame()
+        self.claims = pd.DataFrame()
         self.procedures = []
         self.diagnoses = []
         self.medications = []
 
+        # Code and category lists sampled per record, built once
+        self._icd_keys = list(ICD10_CODES.keys())
+        self._cpt_keys = list(CPT_CODES.keys())
+        self._specialty_keys = list(SPECIALTIES.keys())
+        self._insurance_companies = (
+            "Blue Cross Blue Shield",
+            "UnitedHealthcare",
+            "Aetna",
+            "Cigna",
+            "Humana",
+            "Medicare",
+            "Medicaid"
+        )
+        self._claim_statuses = ('Approved', 'Approved', 'Approved', 'Pending', 'Denied')
+        self._claim_types = ('inpatient', 'outpatient', 'pharmacy', 'emergency')
+
+        # Method that applies each fraud pattern to a batch of base claims
+        self._fraud_methods = {
+            'upcoding': self._fraud_upcoding,
+            'unbundling': self._fraud_unbundling,
+            'phantom_billing': self._fraud_phantom_billing,
+            'excessive_services': self._fraud_excessive_services,
+            'double_billing': self._fraud_double_billing,
+            'drg_creep': self._fraud_drg_creep,
+            'kickback_scheme': self._fraud_kickback_scheme,
+            'service_substitution': self._fraud_service_substitution,
+            'credential_misuse': self._fraud_credential_misuse,
+            'identity_theft': self._fraud_identity_theft,
+            'cloning': self._fraud_cloning,
+            'unnecessary_admissions': self._fraud_unnecessary_admissions,
+            'ping_ponging': self._fraud_ping_ponging,
+            'family_ganging': self._fraud_family_ganging,
+            'los_inflation': self._fraud_los_inflation,
+            'equipment_fraud': self._fraud_equipment_fraud,
+        }
+
+        # Active policies grouped by patient (built once policies exist): the
+        # active policies of patient p are
+        # _active_policies[_active_policy_starts[p]:][:_active_policy_counts[p]]
+        self._active_policies = np.empty(0, dtype=np.int64)
+        self._active_policy_starts = np.empty(0, dtype=np.int64)
+        self._active_policy_counts = np.empty(0, dtype=np.int64)
+
+        # Patient subsets sampled by fraud patterns (built on first use)
+        self._deceased_patients = None
+        self._shared_address_patients = None
+
+        # Claim totals, and the directory claims were streamed to (if any)
+        self._claim_counts = (0, 0)
+        self._claims_output_dir = None
+
         # Fraud tracking
         self.fraud_claim_ids = set()
         self.fraud_patterns_used = {pattern: 0 for pattern in FRAUD_PATTERNS.keys()}
@@ -107,8 +430,15 @@ class HealthInsuranceDataGenerator:
         print(f"   Expected Fraudulent Claims: {int(self.num_claims * self.fraud_rate):,}")
         print()
 
-    def generate_all_data(self):
-        """Generate all data entities."""
+    def generate_all_data(self, output_dir: Optional[str] = None):
+        """
+        Generate all data entities.
+
+        Args:
+            output_dir: If given, claims are generated in chunks of CLAIMS_PER_CHUNK and
+                streamed to claims.csv/.parquet/.feather there instead of kept in self.claims,
+                so memory stays bounded for large datasets
+        """
         print("=" * 80)
         print("GENERATING HEALTH INSURANCE DATA")
         print("=" * 80)
@@ -133,24 +463,19 @@ class HealthInsuranceDataGenerator:
         # Step 5: Generate policies
         print("📋 Step 5/8: Generating insurance policies...")
         self.policies = self._generate_policies()
+        self._index_active_policies()
 
-        # Step 6: Generate normal claims
-        num_normal_claims = int(self.num_claims * (1 - self.fraud_rate))
-        print(f"✅ Step 6/8: Generating {num_normal_claims:,} normal claims...")
-        normal_claims = self._generate_normal_claims(num_normal_claims)
-
-        # Step 7: Generate fraudulent claims
-        num_fraud_claims = self.num_claims - num_normal_claims
-        print(f"🚨 Step 7/8: Generating {num_fraud_claims:,} fraudulent claims...")
-        fraud_claims = self._generate_fraudulent_claims(num_fraud_claims)
-
-        # Combine claims
-        self.claims = normal_claims + fraud_claims
-        random.shuffle(self.claims)  # Mix normal and fraud claims
+        # Steps 6-7: Generate normal and fraudulent claims
+        if output_dir is None:
+            self.claims = self._generate_claims(self.num_claims)
+            self._claim_counts = (len(self.claims), int(self.claims['is_fraudulent'].sum()))
+        else:
+            self._claim_counts = self._stream_claims(output_dir)
+            self._claims_output_dir = output_dir
 
         # Step 8: Generate statistics
         print("📊 Step 8/8: Calculating statistics...")
-        self._print_statistics()
+        self._print_statistics(*self._claim_counts)
 
         print()
         print("=" * 80)
@@ -158,6 +483,67 @@ class HealthInsuranceDataGenerator:
         print("=" * 80)
         print()
 
+    def _generate_claims(self, num_claims: int, verbose: bool = True) -> pd.DataFrame:
+        """
+        Generate normal and fraudulent claims, mixed in random order.
+
+        Args:
+            num_claims: Total number of claims
+            verbose: Print per-step progress
+
+        Returns:
+            Compacted claims DataFrame
+        """
+        # Step 6: Generate normal claims
+        num_normal_claims = int(num_claims * (1 - self.fraud_rate))
+        if verbose:
+            print(f"✅ Step 6/8: Generating {num_normal_claims:,} normal claims...")
+        normal_claims = self._generate_normal_claims(num_normal_claims, verbose)
+
+        # Step 7: Generate fraudulent claims
+        num_fraud_claims = num_claims - num_normal_claims
+        if verbose:
+            print(f"🚨 Step 7/8: Generating {num_fraud_claims:,} fraudulent claims...")
+        fraud_claims = self._generate_fraudulent_claims(num_fraud_claims, verbose)
+
+        # Combine claims
+        claim_frames = [claims for claims in (normal_claims, fraud_claims) if len(claims)]
+        claims = pd.concat(claim_frames, ignore_index=True) if claim_frames else normal_claims
+        # Mix normal and fraud claims
+        claims = claims.iloc[self.rng.permutation(len(claims))].reset_index(drop=True)
+        return self._compact_claims(claims)
+
+    def _stream_claims(self, output_dir: str) -> Tuple[int, int]:
+        """
+        Generate claims chunk by chunk, writing each chunk while the next is generated.
+
+        At most two chunks are held in memory: the one being written on a
+        background thread and the one being generated.
+
+        Args:
+            output_dir: Directory to write claims.csv, claims.parquet and claims.feather to
+
+        Returns:
+            Tuple of (total claims, fraudulent claims) written
+        """
+        print(f"🧾 Steps 6-7/8: Streaming {self.num_claims:,} claims to {output_dir}/ "
+              f"in chunks of {CLAIMS_PER_CHUNK:,}...")
+        writer = ClaimChunkWriter(output_dir)
+        pending_write = None
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for start in range(0, self.num_claims, CLAIMS_PER_CHUNK):
+                chunk = self._generate_claims(min(CLAIMS_PER_CHUNK, self.num_claims - start), verbose=False)
+                if pending_write is not None:
+                    pending_write.result()
+                pending_write = executor.submit(writer.write, chunk)
+                print(f"   ✓ {start + len(chunk):,}/{self.num_claims:,} claims")
+            if pending_write is not None:
+                pending_write.result()
+        writer.close()
+
+        return writer.num_claims, writer.num_fraud_claims
+
     def _generate_reference_data(self):
         """Generate reference data for diagnoses, procedures, and medications."""
         # Convert ICD-10 codes to list format
@@ -198,99 +584,129 @@ class HealthInsuranceDataGenerator:
         print(f"   ✓ {len(self.procedures)} procedures")
         print(f"   ✓ {len(self.medications)} medications")
 
-    def _generate_patients(self) -> List[Dict]:
+    def _generate_patients(self) -> pd.DataFrame:
         """Generate patient records with demographics."""
-        patients = []
-
-        for i in range(self.num_patients):
-            # Determine if phantom patient (for fraud)
-            is_phantom = random.random() < 0.005  # 0.5% phantom patients
-            is_deceased = random.random() < 0.02  # 2% deceased
-
-            # Generate demographics
-            gender = random.choice(['M', 'F', 'Other'])
-            birth_date = fake.date_of_birth(minimum_age=0, maximum_age=90)
-            age = (datetime.now().date() - birth_date).days // 365
-
-            # Generate address (some will share for family ganging fraud)
-            if random.random() < 0.1:  # 10% share addresses (families)
-                if patients:
-                    # Share address with previous patient
-                    prev_patient = random.choice(patients[-10:])  # From last 10
-                    address = prev_patient['address']
-                    city = prev_patient['city']
-                    state = prev_patient['state']
-                    zip_code = prev_patient['zip_code']
-                else:
-                    address = fake.street_address()
-                    city = fake.city()
-                    state = fake.state_abbr()
-                    zip_code = fake.zipcode()
-            else:
-                address = fake.street_address()
-                city = fake.city()
-                state = fake.state_abbr()
-                zip_code = fake.zipcode()
-
-            # Generate chronic conditions based on age
-            chronic_conditions = self._generate_chronic_conditions(age)
-
-            patient = {
-                'patient_id': f"PAT{i:06d}",
-                'first_name': fake.first_name_male() if gender == 'M' else fake.first_name_female(),
-                'last_name': fake.last_name(),
-                'date_of_birth': birth_date.isoformat(),
-                'age': age,
-                'gender': gender,
-                'address': address,
-                'city': city,
-                'state': state,
-                'zip_code': zip_code,
-                'phone': fake.phone_number(),
-                'email': fake.email() if not is_phantom else None,
-                'ssn_hash': fake.sha256(),
-                'registration_date': fake.date_between(start_date='-5y', end_date='today').isoformat(),
-                'is_deceased': is_deceased,
-                'date_of_death': fake.date_between(start_date='-2y', end_date='today').isoformat() if is_deceased else None,
-                'chronic_conditions': chronic_conditions,
-                'is_phantom': is_phantom
-            }
-
-            patients.append(patient)
-
-        print(f"   ✓ Generated {len(patients):,} patients")
-        print(f"     • {sum(1 for p in patients if p['is_deceased'])} deceased")
-        print(f"     • {sum(1 for p in patients if p['is_phantom'])} phantom patients")
-
-        return patients
-
-    def _generate_chronic_conditions(self, age: int) -> List[str]:
-        """Generate realistic chronic conditions based on age."""
-        conditions = []
+        n = self.num_patients
+        today = np.datetime64(datetime.now().date(), 'D')
+
+        # Determine phantom (for fraud) and deceased patients
+        is_phantom = self.rng.random(n) < 0.005  # 0.5% phantom patients
+        is_deceased = self.rng.random(n) < 0.02  # 2% deceased
+
+        # Generate demographics
+        genders = self.rng.choice(['M', 'F', 'Other'], n)
+        birth_dates = today - self.rng.integers(0, 91 * 365, n).astype('timedelta64[D]')
+        ages = (today - birth_dates).astype(int) // 365
+
+        # Generate addresses (some will share for family ganging fraud):
+        # 10% share the address of one of the previous 10 patients (families)
+        shares_address = self.rng.random(n) < 0.1
+        shares_address[0] = False
+        address_source = np.arange(n)
+        offsets = self.rng.integers(1, 11, n)
+        for i in np.flatnonzero(shares_address):
+            address_source[i] = address_source[max(i - offsets[i], 0)]
+
+        own_address = ~shares_address
+        num_addresses = int(own_address.sum())
+
+        # Faker names dominate the cost, so chunks are generated in parallel
+        # (joblib is imported here, as only this step needs it). The chunks and
+        # their seeds depend only on n, so the worker count only affects scheduling.
+        from joblib import Parallel, delayed
+        num_chunks = max(1, -(-n // PATIENTS_PER_WORKER))
+        gender_chunks = np.array_split(genders, num_chunks)
+        seed_sequence = np.random.SeedSequence(int(self.rng.integers(0, 2**31 - 1)))
+        seeds = [int(child.generate_state(1)[0]) for child in seed_sequence.spawn(num_chunks)]
+        chunks = Parallel(n_jobs=min(self.n_jobs, num_chunks))(
+            delayed(_fake_patient_names)(gender_chunk, seed)
+            for gender_chunk, seed in zip(gender_chunks, seeds)
+        )
+        text = {key: [value for chunk in chunks for value in chunk[key]] for key in chunks[0]}
+
+        # Map every patient to the household address they live at
+        household_addresses = self._sample_addresses(num_addresses)
+        pool_index = np.cumsum(own_address) - 1
+        addresses = household_addresses.iloc[pool_index[address_source]].reset_index(drop=True)
+
+        # Generate chronic conditions based on age
+        chronic_conditions = self._generate_chronic_conditions(ages)
+
+        first_names = text['first_name']
+        last_names = text['last_name']
+        emails = _random_emails(self.rng, first_names, last_names)
+        registration_dates = today - self.rng.integers(0, 5 * 365 + 1, n).astype('timedelta64[D]')
+        death_dates = today - self.rng.integers(0, 2 * 365 + 1, n).astype('timedelta64[D]')
+
+        patients_df = pd.DataFrame({
+            'patient_id': [f"PAT{i:06d}" for i in range(n)],
+            'first_name': first_names,
+            'last_name': last_names,
+            'date_of_birth': np.datetime_as_string(birth_dates, unit='D'),
+            'age': ages,
+            'gender': genders,
+            'address': addresses['address'],
+            'city': addresses['city'],
+            'state': addresses['state'],
+            'zip_code': addresses['zip_code'],
+            'phone': _random_phone_numbers(self.rng, n),
+            'email': pd.Series(np.where(is_phantom, None, emails), dtype=object),
+            'ssn_hash': _random_sha256_hashes(self.rng, n),
+            'registration_date': np.datetime_as_string(registration_dates, unit='D'),
+            'is_deceased': is_deceased,
+            'date_of_death': pd.Series(np.where(is_deceased, np.datetime_as_string(death_dates, unit='D'), None), dtype=object),
+            'chronic_conditions': chronic_conditions,
+            'is_phantom': is_phantom
+        })
+
+        print(f"   ✓ Generated {len(patients_df):,} patients")
+        print(f"     • {int(is_deceased.sum())} deceased")
+        print(f"     • {int(is_phantom.sum())} phantom patients")
+
+        return patients_df
+
+    def _sample_addresses(self, n: int) -> pd.DataFrame:
+        """
+        Draw n addresses from the address pool.
 
+        Each address gets its own random building number, so distinct draws
+        almost never produce the same street address.
+
+        Args:
+            n: Number of addresses
+
+        Returns:
+            DataFrame with address, city, state and zip_code columns
+        """
+        pool = self._address_pool.iloc[self.rng.integers(0, len(self._address_pool), n)]
+        building_numbers = self.rng.integers(1, 100000, n).tolist()
+        return pd.DataFrame({
+            'address': [f"{number} {street}" for number, street in zip(building_numbers, pool['street_name'].tolist())],
+            'city': pool['city'].to_numpy(),
+            'state': pool['state'].to_numpy(),
+            'zip_code': _random_zip_codes(self.rng, n),
+        })
+
+    def _generate_chronic_conditions(self, ages: np.ndarray) -> List[List[str]]:
+        """Generate realistic chronic conditions based on age, for all patients at once."""
         # Older patients more likely to have conditions
-        if age > 65:
-            if random.random() < 0.4:
-                conditions.append('hypertension')
-            if random.random() < 0.3:
-                conditions.append('diabetes')
-            if random.random() < 0.2:
-                conditions.append('heart_disease')
-        elif age > 45:
-            if random.random() < 0.2:
-                conditions.append('hypertension')
-            if random.random() < 0.15:
-                conditions.append('diabetes')
-        elif age > 25:
-            if random.random() < 0.05:
-                conditions.append('asthma')
-
-        return conditions
-
-    def _generate_providers(self) -> List[Dict]:
+        over_65 = ages > 65
+        over_45 = ages > 45
+        probabilities = np.column_stack([
+            np.select([over_65, over_45], [0.4, 0.2], 0.0),    # hypertension
+            np.select([over_65, over_45], [0.3, 0.15], 0.0),   # diabetes
+            np.where(over_65, 0.2, 0.0),                       # heart_disease
+            np.where(~over_45 & (ages > 25), 0.05, 0.0),       # asthma
+        ])
+        has_condition = self.rng.random(probabilities.shape) < probabilities
+
+        # Encode each patient's conditions as a 4-bit mask and decode through
+        # a table of the 16 possible condition lists
+        masks = has_condition.astype(np.uint8) @ (1 << np.arange(len(CHRONIC_CONDITIONS), dtype=np.uint8))
+        return [list(CHRONIC_CONDITION_SETS[mask]) for mask in masks.tolist()]
+
+    def _generate_providers(self) -> pd.DataFrame:
         """Generate healthcare provider records."""
-        providers = []
-
         # Distribute provider types
         type_distribution = {
             "Physician - Primary Care": 0.3,
@@ -302,460 +718,393 @@ class HealthInsuranceDataGenerator:
             "Imaging Center": 0.02,
         }
 
-        for i in range(self.num_providers):
-            # Select provider type
-            provider_type = np.random.choice(
-                list(type_distribution.keys()),
-                p=list(type_distribution.values())
-            )
-
-            # Select specialty for physicians
-            if "Physician" in provider_type:
-                specialty = random.choice(list(SPECIALTIES.keys()))
-            else:
-                specialty = None
-
-            # Determine if fraudulent provider
-            has_fraud_history = random.random() < 0.03  # 3% with fraud history
-            is_phantom = random.random() < 0.005  # 0.5% phantom providers
-
-            provider = {
-                'provider_id': generate_npi_number(),
-                'provider_name': generate_provider_name(provider_type),
-                'provider_type': provider_type,
-                'specialty': specialty,
-                'address': fake.street_address(),
-                'city': fake.city(),
-                'state': fake.state_abbr(),
-                'zip_code': fake.zipcode(),
-                'phone': fake.phone_number(),
-                'license_number': generate_license_number(),
-                'license_state': fake.state_abbr(),
-                'years_in_practice': random.randint(1, 40),
-                'is_in_network': random.random() < 0.8,  # 80% in-network
-                'fraud_history': has_fraud_history,
-                'is_phantom': is_phantom
-            }
-
-            providers.append(provider)
-
-        print(f"   ✓ Generated {len(providers):,} providers")
-        print(f"     • {sum(1 for p in providers if p['fraud_history'])} with fraud history")
-        print(f"     • {sum(1 for p in providers if p['is_phantom'])} phantom providers")
-
-        return providers
-
-    def _generate_pharmacies(self) -> List[Dict]:
+        type_names = list(type_distribution.keys())
+        type_idx = self.rng.choice(len(type_names), self.num_providers, p=list(type_distribution.values()))
+        provider_types = [type_names[t] for t in type_idx]
+
+        npi_numbers = generate_npi_batch(self.num_providers, self.rng)
+        provider_names = generate_provider_names(provider_types, self.rng)
+        license_numbers = generate_license_batch(self.num_providers, self.rng)
+        addresses = self._sample_addresses(self.num_providers)
+        license_states = self.rng.choice(self._address_pool['state'].to_numpy(), self.num_providers)
+        phones = _random_phone_numbers(self.rng, self.num_providers)
+        specialties = self.rng.choice(self._specialty_keys, self.num_providers)
+        fraud_history_draws = self.rng.random(self.num_providers)
+        phantom_draws = self.rng.random(self.num_providers)
+        years_in_practice = self.rng.integers(1, 41, self.num_providers)
+        in_network_draws = self.rng.random(self.num_providers)
+
+        # Specialty only applies to physicians
+        is_physician = np.char.find(np.asarray(provider_types, dtype=str), "Physician") >= 0
+
+        providers_df = pd.DataFrame({
+            'provider_id': npi_numbers,
+            'provider_name': provider_names,
+            'provider_type': provider_types,
+            'specialty': np.where(is_physician, np.asarray(specialties, dtype=object), None),
+            'address': addresses['address'],
+            'city': addresses['city'],
+            'state': addresses['state'],
+            'zip_code': addresses['zip_code'],
+            'phone': phones,
+            'license_number': license_numbers,
+            'license_state': license_states,
+            'years_in_practice': years_in_practice,
+            'is_in_network': in_network_draws < 0.8,  # 80% in-network
+            'fraud_history': fraud_history_draws < 0.03,  # 3% with fraud history
+            'is_phantom': phantom_draws < 0.005  # 0.5% phantom providers
+        })
+
+        print(f"   ✓ Generated {len(providers_df):,} providers")
+        print(f"     • {int(providers_df['fraud_history'].sum())} with fraud history")
+        print(f"     • {int(providers_df['is_phantom'].sum())} phantom providers")
+
+        return providers_df
+
+    def _generate_pharmacies(self) -> pd.DataFrame:
         """Generate pharmacy records."""
-        pharmacies = []
-
+        n = self.num_pharmacies
         chains = ["CVS Pharmacy", "Walgreens", "Rite Aid", "Independent Pharmacy"]
 
-        for i in range(self.num_pharmacies):
-            chain_name = random.choice(chains)
+        addresses = self._sample_addresses(n)
+        name_cities = self.rng.choice(self._address_pool['city'].to_numpy(), n)
+        chain_names = self.rng.choice(chains, n)
+        license_numbers = self.rng.integers(100000, 1000000, n)
 
-            pharmacy = {
-                'pharmacy_id': f"PHARM{i:05d}",
-                'pharmacy_name': f"{fake.city()} {chain_name}",
-                'chain_name': chain_name,
-                'address': fake.street_address(),
-                'city': fake.city(),
-                'state': fake.state_abbr(),
-                'zip_code': fake.zipcode(),
-                'phone': fake.phone_number(),
-                'license_number': f"PHRM{random.randint(100000, 999999)}"
-            }
+        pharmacies_df = pd.DataFrame({
+            'pharmacy_id': [f"PHARM{i:05d}" for i in range(n)],
+            'pharmacy_name': np.char.add(np.char.add(name_cities.astype(str), ' '), chain_names),
+            'chain_name': chain_names,
+            'address': addresses['address'],
+            'city': addresses['city'],
+            'state': addresses['state'],
+            'zip_code': addresses['zip_code'],
+            'phone': _random_phone_numbers(self.rng, n),
+            'license_number': np.char.add('PHRM', license_numbers.astype(str))
+        })
 
-            pharmacies.append(pharmacy)
+        print(f"   ✓ Generated {len(pharmacies_df):,} pharmacies")
 
-        print(f"   ✓ Generated {len(pharmacies):,} pharmacies")
+        return pharmacies_df
 
-        return pharmacies
-
-    def _generate_policies(self) -> List[Dict]:
+    def _generate_policies(self) -> pd.DataFrame:
         """Generate insurance policy records."""
-        policies = []
-
-        for i in range(self.num_policies):
-            # Assign to random patient
-            patient = random.choice(self.patients)
-
-            # Policy dates
-            start_date = fake.date_between(start_date='-3y', end_date='today')
-            end_date = start_date + timedelta(days=365)  # 1-year policy
-
-            policy = {
-                'policy_id': f"POL{i:07d}",
-                'patient_id': patient['patient_id'],
-                'policy_number': f"{random.randint(100000000, 999999999)}",
-                'policy_type': random.choice(POLICY_TYPES),
-                'insurance_company': random.choice([
-                    "Blue Cross Blue Shield",
-                    "UnitedHealthcare",
-                    "Aetna",
-                    "Cigna",
-                    "Humana",
-                    "Medicare",
-                    "Medicaid"
-                ]),
-                'coverage_start': start_date.isoformat(),
-                'coverage_end': end_date.isoformat(),
-                'premium_monthly': round(random.uniform(200, 1500), 2),
-                'deductible': random.choice([500, 1000, 2000, 5000, 10000]),
-                'out_of_pocket_max': random.choice([5000, 7500, 10000, 15000]),
-                'copay': random.choice([10, 20, 30, 50]),
-                'status': 'Active' if end_date > datetime.now().date() else 'Expired'
-            }
-
-            policies.append(policy)
-
-        print(f"   ✓ Generated {len(policies):,} policies")
-
-        return policies
-
-    def _generate_normal_claims(self, num_claims: int) -> List[Dict]:
+        n = self.num_policies
+        today = np.datetime64(datetime.now().date(), 'D')
+
+        # Assign each policy to a random patient
+        patient_ids = self.patients['patient_id'].to_numpy()
+        owners = patient_ids[self.rng.integers(0, len(patient_ids), n)]
+
+        # 1-year policies starting within the last 3 years
+        start_dates = today - self.rng.integers(0, 3 * 365 + 1, n).astype('timedelta64[D]')
+        end_dates = start_dates + np.timedelta64(365, 'D')
+
+        policies_df = pd.DataFrame({
+            'policy_id': [f"POL{i:07d}" for i in range(n)],
+            'patient_id': owners,
+            'policy_number': self.rng.integers(100000000, 1000000000, n).astype(str),
+            'policy_type': self.rng.choice(POLICY_TYPES, n),
+            'insurance_company': self.rng.choice(self._insurance_companies, n),
+            'coverage_start': np.datetime_as_string(start_dates, unit='D'),
+            'coverage_end': np.datetime_as_string(end_dates, unit='D'),
+            'premium_monthly': self.rng.uniform(200, 1500, n).round(2),
+            'deductible': self.rng.choice([500, 1000, 2000, 5000, 10000], n),
+            'out_of_pocket_max': self.rng.choice([5000, 7500, 10000, 15000], n),
+            'copay': self.rng.choice([10, 20, 30, 50], n),
+            'status': np.where(end_dates > today, 'Active', 'Expired')
+        })
+
+        print(f"   ✓ Generated {len(policies_df):,} policies")
+
+        return policies_df
+
+    def _index_active_policies(self):
+        """Group active policies by patient for per-claim policy sampling."""
+        active = (self.policies['status'] == 'Active').to_numpy()
+        policies = np.flatnonzero(active)
+        owners = pd.Index(self.patients['patient_id']).get_indexer(self.policies['patient_id'][active])
+
+        self._active_policies = policies[np.argsort(owners, kind='stable')]
+        self._active_policy_counts = np.bincount(owners, minlength=len(self.patients))
+        self._active_policy_starts = np.cumsum(self._active_policy_counts) - self._active_policy_counts
+
+    def _generate_normal_claims(self, num_claims: int, verbose: bool = True) -> pd.DataFrame:
         """Generate normal (non-fraudulent) claims."""
-        claims = []
-
-        for _ in range(num_claims):
-            claim = self._create_normal_claim()
-            claims.append(claim)
+        claims = self._build_claims(num_claims)
 
-        print(f"   ✓ Generated {len(claims):,} normal claims")
+        if verbose:
+            print(f"   ✓ Generated {len(claims):,} normal claims")
 
         return claims
 
-    def _create_normal_claim(self) -> Dict:
-        """Create a single normal claim with medically appropriate data."""
-        # Select random patient with active policy
-        patient = random.choice(self.patients)
-        active_policies = [p for p in self.policies if p['patient_id'] == patient['patient_id']
-                          and p['status'] == 'Active']
+    def _build_claims(self, num_claims: int) -> pd.DataFrame:
+        """Build claims with medically appropriate data, all columns at once."""
+        n = num_claims
 
-        if not active_policies:
-            # Assign a new policy if none exists
-            policy = random.choice(self.policies)
-        else:
-            policy = random.choice(active_policies)
-
-        # Select provider
-        provider = random.choice(self.providers)
+        # Select random patient, one of their active policies, and provider
+        patient_idx = self.rng.integers(0, len(self.patients), n)
+        policy_idx = self._sample_active_policies(patient_idx)
+        provider_idx = self.rng.integers(0, len(self.providers), n)
 
         # Select appropriate diagnosis and procedure based on provider specialty
-        if provider['specialty'] and provider['specialty'] in SPECIALTIES:
-            specialty_data = SPECIALTIES[provider['specialty']]
-            diagnosis_code = random.choice(specialty_data['common_diagnoses'])
-            procedure_code = random.choice(specialty_data['common_procedures'])
-        else:
-            # Random diagnosis and procedure
-            diagnosis_code = random.choice(list(ICD10_CODES.keys()))
-            procedure_code = random.choice(list(CPT_CODES.keys()))
+        diagnosis_codes = np.array(self._icd_keys, dtype=object)[self.rng.integers(0, len(self._icd_keys), n)]
+        procedure_codes = np.array(self._cpt_keys, dtype=object)[self.rng.integers(0, len(self._cpt_keys), n)]
+        specialties = self.providers['specialty'].to_numpy(dtype=object)[provider_idx]
+        for specialty, specialty_data in SPECIALTIES.items():
+            mask = specialties == specialty
+            count = int(mask.sum())
+            diagnosis_codes[mask] = self.rng.choice(np.array(specialty_data['common_diagnoses'], dtype=object), count)
+            procedure_codes[mask] = self.rng.choice(np.array(specialty_data['common_procedures'], dtype=object), count)
 
         # Generate claim dates
-        service_date = fake.date_between(start_date=self.start_date, end_date=self.end_date)
-        submission_date = service_date + timedelta(days=random.randint(1, 30))
+        service_offsets = self.rng.integers(0, self._date_span_days + 1, n).astype('timedelta64[D]')
+        service_dates = np.datetime64(self.start_date.date(), 'D') + service_offsets
+        submission_dates = service_dates + self.rng.integers(1, 31, n).astype('timedelta64[D]')
 
         # Calculate claim amount based on procedure
-        cost_low, cost_high = get_typical_cost(procedure_code)
-        claim_amount = round(random.uniform(cost_low, cost_high), 2)
-        allowed_amount = round(claim_amount * random.uniform(0.7, 0.95), 2)
-        paid_amount = round(allowed_amount * random.uniform(0.8, 1.0), 2)
-
-        claim = {
-            'claim_id': f"CLM{random.randint(1000000, 9999999)}",
-            'patient_id': patient['patient_id'],
-            'policy_id': policy['policy_id'],
-            'provider_id': provider['provider_id'],
-            'claim_number': f"CN{random.randint(100000000, 999999999)}",
-            'submission_date': submission_date.isoformat(),
-            'service_date': service_date.isoformat(),
-            'diagnosis_code': diagnosis_code,
-            'procedure_code': procedure_code,
+        cost_low, cost_high = get_typical_costs_batch(procedure_codes)
+        claim_amount = _random_cents(self.rng, cost_low, cost_high)
+        allowed_amount = np.rint(claim_amount * self.rng.uniform(0.7, 0.95, n)).astype(np.int64)
+        paid_amount = np.rint(allowed_amount * self.rng.uniform(0.8, 1.0, n)).astype(np.int64)
+
+        patient_ids = self.patients['patient_id'].to_numpy(dtype=object)
+        policy_ids = self.policies['policy_id'].to_numpy(dtype=object)
+        provider_ids = self.providers['provider_id'].to_numpy(dtype=object)
+
+        claims = pd.DataFrame({
+            'claim_id': [f"CLM{x}" for x in self.rng.integers(1000000, 10000000, n).tolist()],
+            'patient_id': patient_ids[patient_idx],
+            'policy_id': policy_ids[policy_idx],
+            'provider_id': provider_ids[provider_idx],
+            'claim_number': [f"CN{x}" for x in self.rng.integers(100000000, 1000000000, n).tolist()],
+            'submission_date': submission_dates,
+            'service_date': service_dates,
+            'diagnosis_code': diagnosis_codes,
+            'procedure_code': procedure_codes,
             'claim_amount': claim_amount,
             'allowed_amount': allowed_amount,
             'paid_amount': paid_amount,
-            'patient_responsibility': round(claim_amount - paid_amount, 2),
-            'claim_status': random.choice(['Approved', 'Approved', 'Approved', 'Pending', 'Denied']),
-            'claim_type': random.choice(['inpatient', 'outpatient', 'pharmacy', 'emergency']),
+            'patient_responsibility': claim_amount - paid_amount,
+            'claim_status': self.rng.choice(np.array(self._claim_statuses, dtype=object), n),
+            'claim_type': self.rng.choice(np.array(self._claim_types, dtype=object), n),
             'is_fraudulent': False,
-            'fraud_type': None
-        }
+            'fraud_type': pd.Series([None] * n, dtype=object)
+        }, copy=False)
+
+        return claims
+
+    @staticmethod
+    def _compact_claims(claims: pd.DataFrame) -> pd.DataFrame:
+        """Store claim amounts as int32 cents, dates as datetime64 and codes and entity IDs as categories."""
+        claims = claims.astype({col: dtype for col, dtype in CLAIM_DTYPES.items() if col in claims.columns})
+        for col in CLAIM_DATE_COLUMNS:
+            if col in claims.columns:
+                claims[col] = pd.to_datetime(claims[col], format='ISO8601')
+        return claims
+
+    def _sample_active_policies(self, patient_idx: np.ndarray) -> np.ndarray:
+        """
+        Pick one active policy per claim for the given patients.
+
+        Patients without an active policy get a random policy.
 
-        return claim
+        Args:
+            patient_idx: Index into self.patients for each claim
 
-    def _generate_fraudulent_claims(self, num_fraud_claims: int) -> List[Dict]:
+        Returns:
+            Index into self.policies for each claim
+        """
+        n = len(patient_idx)
+        random_policies = self.rng.integers(0, len(self.policies), n)
+        claim_counts = self._active_policy_counts[patient_idx]
+        has_active = claim_counts > 0
+        if not has_active.any():
+            return random_policies
+        picks = self._active_policy_starts[patient_idx] + (self.rng.random(n) * claim_counts).astype(np.int64)
+        return np.where(has_active, self._active_policies[np.where(has_active, picks, 0)], random_policies)
+
+    def _generate_fraudulent_claims(self, num_fraud_claims: int, verbose: bool = True) -> pd.DataFrame:
         """Generate fraudulent claims across all 16 fraud patterns."""
-        fraud_claims = []
+        # Draw the base claim of every fraudulent claim in one batch
+        base_claims = self._build_claims(num_fraud_claims)
+        base_claims['fraud_details'] = pd.Series([None] * num_fraud_claims, dtype=object)
 
-        # Distribute fraud across all 16 patterns
+        # Distribute fraud across all 16 patterns, the last pattern gets the remainder
         fraud_patterns_list = list(FRAUD_PATTERNS.keys())
         claims_per_pattern = num_fraud_claims // len(fraud_patterns_list)
+        bounds = [i * claims_per_pattern for i in range(len(fraud_patterns_list))] + [num_fraud_claims]
 
-        for pattern_name in fraud_patterns_list:
-            pattern_claims = claims_per_pattern
-            if pattern_name == fraud_patterns_list[-1]:  # Last pattern gets remainder
-                pattern_claims = num_fraud_claims - len(fraud_claims)
+        pattern_frames = []
+        for pattern_name, start, end in zip(fraud_patterns_list, bounds[:-1], bounds[1:]):
+            if verbose:
+                print(f"      • Generating {end - start} {pattern_name} claims...")
 
-            print(f"      • Generating {pattern_claims} {pattern_name} claims...")
+            claims = self._generate_fraud_claims(pattern_name, base_claims.iloc[start:end].copy())
+            pattern_frames.append(claims)
+            self.fraud_patterns_used[pattern_name] += len(claims)
 
-            for _ in range(pattern_claims):
-                claim = self._generate_fraud_claim(pattern_name)
-                if claim:
-                    fraud_claims.append(claim)
-                    self.fraud_patterns_used[pattern_name] += 1
+        fraud_claims = pd.concat(pattern_frames, ignore_index=True)
 
-        print(f"   ✓ Generated {len(fraud_claims):,} fraudulent claims across {len(fraud_patterns_list)} patterns")
+        if verbose:
+            print(f"   ✓ Generated {len(fraud_claims):,} fraudulent claims across {len(fraud_patterns_list)} patterns")
 
         return fraud_claims
 
-    def _generate_fraud_claim(self, pattern_name: str) -> Optional[Dict]:
-        """Generate a fraudulent claim based on specific pattern."""
-        # Dispatch to specific fraud generation method
-        fraud_methods = {
-            'upcoding': self._fraud_upcoding,
-            'unbundling': self._fraud_unbundling,
-            'phantom_billing': self._fraud_phantom_billing,
-            'excessive_services': self._fraud_excessive_services,
-            'double_billing': self._fraud_double_billing,
-            'drg_creep': self._fraud_drg_creep,
-            'kickback_scheme': self._fraud_kickback_scheme,
-            'service_substitution': self._fraud_service_substitution,
-            'credential_misuse': self._fraud_credential_misuse,
-            'identity_theft': self._fraud_identity_theft,
-            'cloning': self._fraud_cloning,
-            'unnecessary_admissions': self._fraud_unnecessary_admissions,
-            'ping_ponging': self._fraud_ping_ponging,
-            'family_ganging': self._fraud_family_ganging,
-            'los_inflation': self._fraud_los_inflation,
-            'equipment_fraud': self._fraud_equipment_fraud,
-        }
-
-        if pattern_name in fraud_methods:
-            return fraud_methods[pattern_name]()
+    def _generate_fraud_claims(self, pattern_name: str, claims: pd.DataFrame) -> pd.DataFrame:
+        """Turn a batch of base claims into fraudulent claims based on specific pattern."""
+        if pattern_name in self._fraud_methods:
+            return self._fraud_methods[pattern_name](claims)
         else:
             # Fallback to generic fraud
-            return self._create_normal_claim()
+            return claims
 
-    def _fraud_upcoding(self) -> Dict:
-        """Generate upcoding fraud: billing expensive procedure for simple diagnosis."""
-        claim = self._create_normal_claim()
+    @staticmethod
+    def _mark_fraud(claims: pd.DataFrame, fraud_type: str, fraud_details=None) -> pd.DataFrame:
+        """Flag a batch of claims as fraudulent, with optional details (a string or one per claim)."""
+        if fraud_details is not None:
+            claims['fraud_details'] = fraud_details
+        claims['is_fraudulent'] = True
+        claims['fraud_type'] = fraud_type
+
+        return claims
 
+    def _fraud_upcoding(self, claims: pd.DataFrame) -> pd.DataFrame:
+        """Generate upcoding fraud: billing expensive procedure for simple diagnosis."""
         # Replace with simple diagnosis but expensive procedure
-        claim['diagnosis_code'] = 'Z00.00'  # Routine checkup
-        claim['procedure_code'] = '99285'  # High-complexity emergency visit
+        claims['diagnosis_code'] = 'Z00.00'  # Routine checkup
+        claims['procedure_code'] = '99285'  # High-complexity emergency visit
 
         # Inflate cost
-        cost_low, cost_high = get_typical_cost(claim['procedure_code'])
-        claim['claim_amount'] = round(cost_high * random.uniform(1.2, 1.5), 2)
-
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'upcoding'
+        cost_low, cost_high = get_typical_cost('99285')
+        claims['claim_amount'] = np.rint(cost_high * 100 * self.rng.uniform(1.2, 1.5, len(claims))).astype(np.int64)
 
-        return claim
+        return self._mark_fraud(claims, 'upcoding')
 
-    def _fraud_unbundling(self) -> Dict:
+    def _fraud_unbundling(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate unbundling fraud: billing separately for bundled services."""
-        claim = self._create_normal_claim()
-
         # Should bill 45380 (colonoscopy with biopsy) but unbundled to 45378 + 88305
-        claim['procedure_code'] = '45378'  # Colonoscopy without biopsy
-        claim['diagnosis_code'] = 'K80.20'  # Gallbladder issue
+        claims['procedure_code'] = '45378'  # Colonoscopy without biopsy
+        claims['diagnosis_code'] = 'K80.20'  # Gallbladder issue
 
         # Add note about unbundling
-        claim['fraud_details'] = "Unbundled from 45380"
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'unbundling'
-
-        return claim
+        return self._mark_fraud(claims, 'unbundling', "Unbundled from 45380")
 
-    def _fraud_phantom_billing(self) -> Dict:
+    def _fraud_phantom_billing(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate phantom billing: claims for deceased patients."""
-        # Select deceased patient
-        deceased_patients = [p for p in self.patients if p['is_deceased']]
-        if not deceased_patients:
+        # Select deceased patients
+        if self._deceased_patients is None:
+            # Patient ids and dates of death, with the dates parsed once
+            deceased = self.patients[self.patients['is_deceased']]
+            self._deceased_patients = (
+                deceased['patient_id'].to_numpy(dtype=object),
+                np.array(deceased['date_of_death'].tolist(), dtype='datetime64[D]'),
+            )
+        patient_ids, death_dates = self._deceased_patients
+        if not len(patient_ids):
             # Fallback to phantom provider
-            return self._create_normal_claim()
+            return claims
 
-        patient = random.choice(deceased_patients)
-        claim = self._create_normal_claim()
+        picks = self.rng.integers(0, len(patient_ids), len(claims))
 
         # Service date after death
-        death_date = datetime.fromisoformat(patient['date_of_death'])
-        claim['service_date'] = (death_date + timedelta(days=random.randint(10, 365))).isoformat()
-        claim['patient_id'] = patient['patient_id']
-
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'phantom_billing'
+        claims['service_date'] = death_dates[picks] + self.rng.integers(10, 366, len(claims)).astype('timedelta64[D]')
+        claims['patient_id'] = patient_ids[picks]
 
-        return claim
+        return self._mark_fraud(claims, 'phantom_billing')
 
-    def _fraud_excessive_services(self) -> Dict:
+    def _fraud_excessive_services(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate excessive services fraud: unnecessary repeated procedures."""
-        claim = self._create_normal_claim()
-
         # Mark as part of excessive series
-        claim['fraud_details'] = f"Part of excessive series ({random.randint(5, 20)} similar claims in 30 days)"
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'excessive_services'
-
-        return claim
+        series_sizes = self.rng.integers(5, 21, len(claims)).tolist()
+        return self._mark_fraud(claims, 'excessive_services', [
+            f"Part of excessive series ({size} similar claims in 30 days)" for size in series_sizes
+        ])
 
-    def _fraud_double_billing(self) -> Dict:
+    def _fraud_double_billing(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate double billing: same service billed multiple times."""
-        claim = self._create_normal_claim()
-
         # Slight variation in amount
-        claim['claim_amount'] = round(claim['claim_amount'] * random.uniform(0.95, 1.05), 2)
-        claim['fraud_details'] = "Duplicate of another claim with slight variation"
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'double_billing'
+        claims['claim_amount'] = np.rint(claims['claim_amount'] * self.rng.uniform(0.95, 1.05, len(claims))).astype(np.int64)
+        return self._mark_fraud(claims, 'double_billing', "Duplicate of another claim with slight variation")
 
-        return claim
-
-    def _fraud_drg_creep(self) -> Dict:
+    def _fraud_drg_creep(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate DRG creep: inflated diagnosis codes."""
-        claim = self._create_normal_claim()
-
         # Replace with more severe diagnosis
-        claim['diagnosis_code'] = 'I11.0'  # Hypertensive heart disease with heart failure
+        claims['diagnosis_code'] = 'I11.0'  # Hypertensive heart disease with heart failure
         # But procedure doesn't match severity
-        claim['procedure_code'] = '99213'  # Simple office visit
+        claims['procedure_code'] = '99213'  # Simple office visit
 
-        claim['fraud_details'] = "Diagnosis inflated for higher reimbursement"
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'drg_creep'
+        return self._mark_fraud(claims, 'drg_creep', "Diagnosis inflated for higher reimbursement")
 
-        return claim
-
-    def _fraud_kickback_scheme(self) -> Dict:
+    def _fraud_kickback_scheme(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate kickback scheme: inappropriate referrals."""
-        claim = self._create_normal_claim()
-
-        claim['fraud_details'] = "Part of kickback referral network"
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'kickback_scheme'
+        return self._mark_fraud(claims, 'kickback_scheme', "Part of kickback referral network")
 
-        return claim
-
-    def _fraud_service_substitution(self) -> Dict:
+    def _fraud_service_substitution(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate service substitution: billing for different service."""
-        claim = self._create_normal_claim()
-
         # Billed procedure doesn't match diagnosis
-        claim['diagnosis_code'] = 'M54.5'  # Back pain
-        claim['procedure_code'] = '70450'  # Brain CT scan (inappropriate)
-
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'service_substitution'
+        claims['diagnosis_code'] = 'M54.5'  # Back pain
+        claims['procedure_code'] = '70450'  # Brain CT scan (inappropriate)
 
-        return claim
+        return self._mark_fraud(claims, 'service_substitution')
 
-    def _fraud_credential_misuse(self) -> Dict:
+    def _fraud_credential_misuse(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate credential misuse: using another provider's credentials."""
-        claim = self._create_normal_claim()
+        return self._mark_fraud(claims, 'credential_misuse', "Provider credentials potentially misused")
 
-        claim['fraud_details'] = "Provider credentials potentially misused"
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'credential_misuse'
-
-        return claim
-
-    def _fraud_identity_theft(self) -> Dict:
+    def _fraud_identity_theft(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate identity theft: stolen patient information."""
-        claim = self._create_normal_claim()
-
         # Service in distant location
-        claim['fraud_details'] = "Service location geographically impossible for patient"
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'identity_theft'
-
-        return claim
+        return self._mark_fraud(claims, 'identity_theft', "Service location geographically impossible for patient")
 
-    def _fraud_cloning(self) -> Dict:
+    def _fraud_cloning(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate cloning: copying treatment from one patient to another."""
-        claim = self._create_normal_claim()
+        return self._mark_fraud(claims, 'cloning', "Cloned from another patient's treatment")
 
-        claim['fraud_details'] = "Cloned from another patient's treatment"
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'cloning'
-
-        return claim
-
-    def _fraud_unnecessary_admissions(self) -> Dict:
+    def _fraud_unnecessary_admissions(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate unnecessary admissions: admitting patients unnecessarily."""
-        claim = self._create_normal_claim()
-
         # Low severity diagnosis but hospital admission
-        claim['diagnosis_code'] = 'Z00.00'  # Routine checkup
-        claim['claim_type'] = 'inpatient'
-        claim['claim_amount'] = round(random.uniform(5000, 15000), 2)
+        claims['diagnosis_code'] = 'Z00.00'  # Routine checkup
+        claims['claim_type'] = 'inpatient'
+        claims['claim_amount'] = _random_cents(self.rng, 5000, 15000, len(claims))
 
-        claim['fraud_details'] = "Unnecessary hospital admission for outpatient condition"
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'unnecessary_admissions'
+        return self._mark_fraud(claims, 'unnecessary_admissions', "Unnecessary hospital admission for outpatient condition")
 
-        return claim
-
-    def _fraud_ping_ponging(self) -> Dict:
+    def _fraud_ping_ponging(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate ping-ponging: unnecessary back-and-forth referrals."""
-        claim = self._create_normal_claim()
-
-        claim['fraud_details'] = "Part of ping-pong referral pattern"
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'ping_ponging'
-
-        return claim
+        return self._mark_fraud(claims, 'ping_ponging', "Part of ping-pong referral pattern")
 
-    def _fraud_family_ganging(self) -> Dict:
+    def _fraud_family_ganging(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate family ganging: billing all family members."""
-        claim = self._create_normal_claim()
+        # Select patients with shared address
+        if self._shared_address_patients is None:
+            self._shared_address_patients = self._build_shared_address_patients()
 
-        # Select patient with shared address
-        shared_address_patients = [
-            p for p in self.patients
-            if any(p2['address'] == p['address'] and p2['patient_id'] != p['patient_id']
-                  for p2 in self.patients)
-        ]
-
-        if shared_address_patients:
-            patient = random.choice(shared_address_patients)
-            claim['patient_id'] = patient['patient_id']
+        if len(self._shared_address_patients):
+            picks = self.rng.integers(0, len(self._shared_address_patients), len(claims))
+            claims['patient_id'] = self._shared_address_patients[picks]
 
-        claim['fraud_details'] = "Billed to multiple family members for single service"
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'family_ganging'
+        return self._mark_fraud(claims, 'family_ganging', "Billed to multiple family members for single service")
 
-        return claim
+    def _build_shared_address_patients(self) -> np.ndarray:
+        """Find the ids of the patients whose address is shared by at least one other patient."""
+        shared = self.patients['address'].duplicated(keep=False)
+        return self.patients.loc[shared, 'patient_id'].to_numpy(dtype=object)
 
-    def _fraud_los_inflation(self) -> Dict:
+    def _fraud_los_inflation(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate LOS inflation: extending hospital stays."""
-        claim = self._create_normal_claim()
-
-        claim['claim_type'] = 'inpatient'
-        claim['claim_amount'] = round(random.uniform(10000, 30000), 2)
-        claim['fraud_details'] = "Hospital stay extended beyond medical necessity"
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'los_inflation'
+        claims['claim_type'] = 'inpatient'
+        claims['claim_amount'] = _random_cents(self.rng, 10000, 30000, len(claims))
+        return self._mark_fraud(claims, 'los_inflation', "Hospital stay extended beyond medical necessity")
 
-        return claim
-
-    def _fraud_equipment_fraud(self) -> Dict:
+    def _fraud_equipment_fraud(self, claims: pd.DataFrame) -> pd.DataFrame:
         """Generate equipment fraud: billing for undelivered equipment."""
-        claim = self._create_normal_claim()
-
-        claim['procedure_code'] = '97110'  # Equipment/therapy
-        claim['claim_amount'] = round(random.uniform(2000, 8000), 2)
-        claim['fraud_details'] = "Medical equipment billed but not delivered"
-        claim['is_fraudulent'] = True
-        claim['fraud_type'] = 'equipment_fraud'
+        claims['procedure_code'] = '97110'  # Equipment/therapy
+        claims['claim_amount'] = _random_cents(self.rng, 2000, 8000, len(claims))
+        return self._mark_fraud(claims, 'equipment_fraud', "Medical equipment billed but not delivered")
 
-        return claim
-
-    def _print_statistics(self):
+    def _print_statistics(self, total_claims: int, fraud_claims: int):
         """Print generation statistics."""
-        total_claims = len(self.claims)
-        fraud_claims = sum(1 for c in self.claims if c['is_fraudulent'])
-
         print()
         print("   📊 GENERATION STATISTICS")
         print("   " + "-" * 76)
@@ -769,56 +1118,118 @@ class HealthInsuranceDataGenerator:
                 pct = (count / fraud_claims * 100) if fraud_claims > 0 else 0
                 print(f"      • {pattern:25s}: {count:5,} ({pct:4.1f}%)")
 
-    def save_to_csv(self, output_dir: str = "data"):
-        """Save all generated data to CSV files."""
-        os.makedirs(output_dir, exist_ok=True)
+    def _save_claims(self, output_dir: str) -> str:
+        """
+        Save the in-memory claims to claims.csv, claims.parquet and claims.feather.
 
-        print()
-        print(f"💾 Saving data to {output_dir}/...")
+        Claims are written in batches of PARQUET_ROW_GROUP_SIZE, one Parquet row group each.
+
+        Args:
+            output_dir: Output directory
+
+        Returns:
+            Summary line for the saved claims
+        """
+        writer = ClaimChunkWriter(output_dir)
+        for start in range(0, len(self.claims), PARQUET_ROW_GROUP_SIZE):
+            writer.write(self.claims.iloc[start:start + PARQUET_ROW_GROUP_SIZE])
+        writer.close()
+        return f"   ✓ claims ({len(self.claims):,} records)"
+
+    @staticmethod
+    def _save_table(table: pd.DataFrame, output_dir: str, name: str) -> str:
+        """
+        Save a table as {name}.csv and, when pyarrow is installed, {name}.parquet and {name}.feather.
 
-        # Save patients
-        pd.DataFrame(self.patients).to_csv(f"{output_dir}/patients.csv", index=False)
-        print(f"   ✓ patients.csv ({len(self.patients):,} records)")
+        With pyarrow, all files are written from one Arrow table: the CSV by
+        pyarrow's multi-threaded writer, then the Snappy-compressed Parquet copy
+        and the uncompressed Feather copy, so the data loader prefers them.
 
-        # Save providers
-        pd.DataFrame(self.providers).to_csv(f"{output_dir}/providers.csv", index=False)
-        print(f"   ✓ providers.csv ({len(self.providers):,} records)")
+        Args:
+            table: Table to save
+            output_dir: Output directory
+            name: Table name (file name without extension)
 
-        # Save pharmacies
-        pd.DataFrame(self.pharmacies).to_csv(f"{output_dir}/pharmacies.csv", index=False)
-        print(f"   ✓ pharmacies.csv ({len(self.pharmacies):,} records)")
+        Returns:
+            Summary line for the saved files
+        """
+        table = _as_read_from_csv(table)
+        try:
+            import pyarrow as pa
+            import pyarrow.feather as feather
+            import pyarrow.parquet as pq
+        except ImportError:
+            table.to_csv(f"{output_dir}/{name}.csv", index=False)
+            return f"   ✓ {name}.csv ({len(table):,} records)"
+
+        arrow_table = pa.Table.from_pandas(table, preserve_index=False)
+        _write_arrow_csv(arrow_table, f"{output_dir}/{name}.csv")
+        pq.write_table(arrow_table, f"{output_dir}/{name}.parquet", compression='snappy', use_dictionary=True)
+        feather.write_feather(arrow_table, f"{output_dir}/{name}.feather", compression='uncompressed')
+        return f"   ✓ {name}.csv, {name}.parquet, {name}.feather ({len(table):,} records)"
+
+    def save_to_csv(self, output_dir: str = "data", compress_metadata: bool = False):
+        """
+        Save all generated data to CSV files, with Parquet and Feather copies when pyarrow is installed.
 
-        # Save policies
-        pd.DataFrame(self.policies).to_csv(f"{output_dir}/policies.csv", index=False)
-        print(f"   ✓ policies.csv ({len(self.policies):,} records)")
+        Args:
+            output_dir: Output directory
+            compress_metadata: Write metadata.json.zst (zstd, via pyarrow) instead of metadata.json
+        """
+        os.makedirs(output_dir, exist_ok=True)
 
-        # Save claims
-        pd.DataFrame(self.claims).to_csv(f"{output_dir}/claims.csv", index=False)
-        print(f"   ✓ claims.csv ({len(self.claims):,} records)")
+        print()
+        print(f"💾 Saving data to {output_dir}/...")
+
+        # The files are independent, so they are written on parallel threads
+        # (pyarrow and pandas release the GIL while encoding and writing)
+        tables = [
+            ('patients', self.patients),
+            ('providers', self.providers),
+            ('pharmacies', self.pharmacies),
+            ('policies', self.policies),
+            ('diagnoses', pd.DataFrame(self.diagnoses)),
+            ('procedures', pd.DataFrame(self.procedures)),
+            ('medications', pd.DataFrame(self.medications)),
+        ]
+        with ThreadPoolExecutor(max_workers=len(tables) + 1) as executor:
+            saves = [executor.submit(self._save_table, table, output_dir, name) for name, table in tables]
 
-        # Save reference data
-        pd.DataFrame(self.diagnoses).to_csv(f"{output_dir}/diagnoses.csv", index=False)
-        pd.DataFrame(self.procedures).to_csv(f"{output_dir}/procedures.csv", index=False)
-        pd.DataFrame(self.medications).to_csv(f"{output_dir}/medications.csv", index=False)
+            # Save claims (unless they were already streamed here)
+            if self._claims_output_dir is not None and os.path.abspath(self._claims_output_dir) == os.path.abspath(output_dir):
+                print(f"   ✓ claims (streamed, {self._claim_counts[0]:,} records)")
+            else:
+                saves.append(executor.submit(self._save_claims, output_dir))
 
-        print(f"   ✓ diagnoses.csv ({len(self.diagnoses)} records)")
-        print(f"   ✓ procedures.csv ({len(self.procedures)} records)")
-        print(f"   ✓ medications.csv ({len(self.medications)} records)")
+            for save in saves:
+                print(save.result())
 
         # Save metadata
         metadata = {
             'generation_date': datetime.now().isoformat(),
             'num_patients': self.num_patients,
             'num_providers': self.num_providers,
-            'num_claims': len(self.claims),
+            'num_claims': self._claim_counts[0],
             'fraud_rate': self.fraud_rate,
             'fraud_patterns_used': self.fraud_patterns_used
         }
 
-        with open(f"{output_dir}/metadata.json", 'w') as f:
-            json.dump(metadata, f, indent=2)
-
-        print(f"   ✓ metadata.json")
+        metadata_json = orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        if compress_metadata:
+            try:
+                import pyarrow as pa
+            except ImportError:
+                print("   ⚠️  pyarrow not installed, writing uncompressed metadata.json")
+                compress_metadata = False
+
+        if compress_metadata:
+            with pa.output_stream(f"{output_dir}/metadata.json.zst", compression='zstd') as f:
+                f.write(metadata_json)
+            print(f"   ✓ metadata.json.zst")
+        else:
+            with open(f"{output_dir}/metadata.json", 'wb') as f:
+                f.write(metadata_json)
+            print(f"   ✓ metadata.json")
         print()
         print(f"✅ All data saved to {output_dir}/")
 
@@ -826,17 +1237,19 @@ class HealthInsuranceDataGenerator:
 def main():
     """Main entry point for data generation."""
     # Parse command line arguments
-    if len(sys.argv) < 3:
-        print("Usage: python health_data_generator.py <num_patients> <num_claims> [fraud_rate]")
+    compress_metadata = '--compress' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--compress']
+    if len(args) < 2:
+        print("Usage: python health_data_generator.py <num_patients> <num_claims> [fraud_rate] [--compress]")
         print()
         print("Example:")
         print("  python health_data_generator.py 10000 50000 0.15")
         print("  (Generates 10,000 patients, 50,000 claims with 15% fraud rate)")
         sys.exit(1)
 
-    num_patients = int(sys.argv[1])
-    num_claims = int(sys.argv[2])
-    fraud_rate = float(sys.argv[3]) if len(sys.argv) > 3 else 0.15
+    num_patients = int(args[0])
+    num_claims = int(args[1])
+    fraud_rate = float(args[2]) if len(args) > 2 else 0.15
 
     # Create generator
     generator = HealthInsuranceDataGenerator(
@@ -845,11 +1258,13 @@ def main():
         fraud_rate=fraud_rate
     )
 
-    # Generate all data
-    generator.generate_all_data()
+    # Generate all data, streaming claims straight to disk when there are too
+    # many to hold in memory comfortably
+    output_dir = "data"
+    generator.generate_all_data(output_dir=output_dir if num_claims > CLAIMS_PER_CHUNK else None)
 
     # Save to CSV
-    generator.save_to_csv()
+    generator.save_to_csv(output_dir, compress_metadata=compress_metadata)
 
     print()
     print("=" * 80)
@@ -3,6 +3,10 @@ Medical reference data including ICD-10 diagnosis codes, CPT procedure codes,
 NDC medication codes, and medical specialties.
 """
 
+import types
+
+import numpy as np
+
 # ICD-10 Diagnosis Codes (International Classification of Diseases, 10th Revision)
 ICD10_CODES = {
     # Diabetes
@@ -354,6 +358,51 @@ APPROPRIATE_COMBINATIONS = {
 }
 
 
+def _freeze(value):
+    """
+    Return a read-only copy of nested reference data.
+
+    Args:
+        value: Dict, list or scalar
+
+    Returns:
+        Dicts as read-only mapping views and lists as tuples, recursively
+    """
+    if isinstance(value, dict):
+        return types.MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Freeze the reference maps at import, nested entries included: appropriate
+# procedures become frozensets (O(1) membership checks), every other map
+# becomes a read-only view and every list a tuple
+APPROPRIATE_COMBINATIONS = types.MappingProxyType({
+    diagnosis_code: frozenset(procedure_codes)
+    for diagnosis_code, procedure_codes in APPROPRIATE_COMBINATIONS.items()
+})
+ICD10_CODES = _freeze(ICD10_CODES)
+CPT_CODES = _freeze(CPT_CODES)
+NDC_CODES = _freeze(NDC_CODES)
+SPECIALTIES = _freeze(SPECIALTIES)
+FRAUD_PATTERNS = _freeze(FRAUD_PATTERNS)
+
+# Diagnoses with known appropriate procedures, and every appropriate
+# (diagnosis, procedure) pair, for single-lookup checks
+_KNOWN_DIAGNOSES = frozenset(APPROPRIATE_COMBINATIONS)
+_APPROPRIATE_PAIRS = frozenset(
+    (diagnosis_code, procedure_code)
+    for diagnosis_code, procedure_codes in APPROPRIATE_COMBINATIONS.items()
+    for procedure_code in procedure_codes
+)
+
+# CPT cost ranges in sorted code order, for batch lookups
+_CPT_SORTED_CODES = np.array(sorted(CPT_CODES))
+_CPT_COST_LOW = np.array([CPT_CODES[code]["cost_low"] for code in _CPT_SORTED_CODES])
+_CPT_COST_HIGH = np.array([CPT_CODES[code]["cost_high"] for code in _CPT_SORTED_CODES])
+
+
 def is_appropriate_combination(diagnosis_code: str, procedure_code: str) -> bool:
     """
     Check if a diagnosis-procedure combination is medically appropriate.
@@ -365,9 +414,9 @@ def is_appropriate_combination(diagnosis_code: str, procedure_code: str) -> bool
     Returns:
         True if combination is appropriate, False otherwise
     """
-    if diagnosis_code in APPROPRIATE_COMBINATIONS:
-        return procedure_code in APPROPRIATE_COMBINATIONS[diagnosis_code]
-    return True  # Unknown combinations default to appropriate
+    if diagnosis_code not in _KNOWN_DIAGNOSES:
+        return True  # Unknown combinations default to appropriate
+    return (diagnosis_code, procedure_code) in _APPROPRIATE_PAIRS
 
 
 def get_typical_cost(procedure_code: str) -> tuple:
@@ -383,3 +432,22 @@ def get_typical_cost(procedure_code: str) -> tuple:
     if procedure_code in CPT_CODES:
         return (CPT_CODES[procedure_code]["cost_low"], CPT_CODES[procedure_code]["cost_high"])
     return (0, 0)
+
+
+def get_typical_costs_batch(procedure_codes) -> tuple:
+    """
+    Get the typical cost ranges for many procedures at once.
+
+    Args:
+        procedure_codes: Array-like of CPT procedure codes
+
+    Returns:
+        Tuple of (low, high) cost arrays, with 0 for codes that are not found
+    """
+    codes = np.asarray(procedure_codes).astype(str)
+    positions = np.minimum(np.searchsorted(_CPT_SORTED_CODES, codes), len(_CPT_SORTED_CODES) - 1)
+    found = _CPT_SORTED_CODES[positions] == codes
+    return (
+        np.where(found, _CPT_COST_LOW[positions], 0),
+        np.where(found, _CPT_COST_HIGH[positions], 0),
+    )
@@ -2,9 +2,56 @@
 Healthcare provider data generation utilities.
 """
 import random
+from typing import List, Optional
 from faker import Faker
+import numpy as np
 
-fake = Faker()
+# Shared Faker instance, created on first use; see _fake()
+_FAKE_SINGLETON: Optional[Faker] = None
+
+# Private Faker instance for seeded batch generation, created on first use; see _seeded_fake()
+_SEEDED_FAKE: Optional[Faker] = None
+
+# Upper bound on Faker calls per value pool in generate_provider_names;
+# larger batches draw repeated values from the pool
+PROVIDER_NAME_POOL_SIZE = 1000
+
+
+def _fake() -> Faker:
+    """
+    Get the shared Faker instance, creating it on first use.
+
+    Building a Faker instance loads its locale providers, so the unseeded
+    helpers in this module reuse one instance instead of constructing their own.
+    It is never reseeded; seeded generation uses _seeded_fake().
+
+    Returns:
+        Shared Faker instance
+    """
+    global _FAKE_SINGLETON
+    if _FAKE_SINGLETON is None:
+        _FAKE_SINGLETON = Faker()
+    return _FAKE_SINGLETON
+
+
+def _seeded_fake(seed: int) -> Faker:
+    """
+    Get the private batch Faker instance, reseeded for this batch.
+
+    The instance is built once per process and only reseeded afterwards, so
+    batches are reproducible without reseeding the shared _fake() instance.
+
+    Args:
+        seed: Seed for this batch
+
+    Returns:
+        Seeded Faker instance
+    """
+    global _SEEDED_FAKE
+    if _SEEDED_FAKE is None:
+        _SEEDED_FAKE = Faker()
+    _SEEDED_FAKE.seed_instance(seed)
+    return _SEEDED_FAKE
 
 
 def generate_npi_number() -> str:
@@ -29,6 +76,45 @@ def generate_license_number() -> str:
     return f"{prefix}{number}"
 
 
+def _random_digit_strings(rng: np.random.Generator, n: int, length: int) -> np.ndarray:
+    """Generate n strings of `length` random decimal digits in one vectorized draw."""
+    digits = rng.integers(0, 10, (n, length), dtype=np.uint8) + ord('0')
+    return digits.view(f'S{length}').ravel().astype(str)
+
+
+def generate_npi_batch(n: int, rng: Optional[np.random.Generator] = None) -> List[str]:
+    """
+    Generate many fake NPI numbers at once.
+
+    Args:
+        n: Number of NPI numbers
+        rng: Random number generator (a fresh unseeded one if omitted)
+
+    Returns:
+        List of 10-digit NPI numbers as strings
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    # No leading zero, so the id reads back from CSV as the same 10-digit number
+    first_digits = rng.integers(1, 10, n).astype(str)
+    return np.char.add(first_digits, _random_digit_strings(rng, n, 9)).tolist()
+
+
+def generate_license_batch(n: int, rng: Optional[np.random.Generator] = None) -> List[str]:
+    """
+    Generate many fake medical license numbers at once.
+
+    Args:
+        n: Number of license numbers
+        rng: Random number generator (a fresh unseeded one if omitted)
+
+    Returns:
+        List of license number strings
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    prefixes = rng.choice(['MD', 'DO', 'NP', 'PA'], n)
+    return np.char.add(prefixes, _random_digit_strings(rng, n, 6)).tolist()
+
+
 HOSPITAL_NAMES = [
     "General Hospital",
     "Medical Center",
@@ -75,16 +161,77 @@ def generate_provider_name(provider_type: str) -> str:
         Provider name string
     """
     if "Hospital" in provider_type:
-        city = fake.city()
+        city = _fake().city()
         return f"{city} {random.choice(HOSPITAL_NAMES)}"
     elif "Clinic" in provider_type:
-        return f"{fake.city()} {random.choice(CLINIC_NAMES)}"
+        return f"{_fake().city()} {random.choice(CLINIC_NAMES)}"
     elif "Pharmacy" in provider_type:
         chain = random.choice(PHARMACY_CHAINS)
         if chain == "Independent Pharmacy":
-            return f"{fake.last_name()}'s Pharmacy"
+            return f"{_fake().last_name()}'s Pharmacy"
         return chain
     elif "Physician" in provider_type:
-        return f"Dr. {fake.name()}"
+        return f"Dr. {_fake().name()}"
     else:
-        return f"{fake.company()} {provider_type}"
+        return f"{_fake().company()} {provider_type}"
+
+
+def generate_provider_names(provider_types: List[str], rng: Optional[np.random.Generator] = None) -> List[str]:
+    """
+    Generate realistic provider names for many providers at once.
+
+    Names follow the same rules as generate_provider_name. Batches larger than
+    PROVIDER_NAME_POOL_SIZE per naming rule draw their Faker values (cities,
+    names, companies) from a pool of that size instead of calling Faker per provider.
+
+    Args:
+        provider_types: Type of each provider
+        rng: Random number generator (a fresh unseeded one if omitted)
+
+    Returns:
+        Provider name for each provider
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    batch_fake = _seeded_fake(int(rng.integers(0, 2**31 - 1)))
+
+    def pooled(factory, count: int) -> np.ndarray:
+        if count <= PROVIDER_NAME_POOL_SIZE:
+            return np.array([factory() for _ in range(count)], dtype=str)
+        pool = np.array([factory() for _ in range(PROVIDER_NAME_POOL_SIZE)], dtype=str)
+        return pool[rng.integers(0, len(pool), count)]
+
+    def choices(options: List[str], count: int) -> np.ndarray:
+        return np.asarray(options)[rng.integers(0, len(options), count)]
+
+    def joined(*parts) -> np.ndarray:
+        result = parts[0]
+        for part in parts[1:]:
+            result = np.char.add(result, part)
+        return result
+
+    # Bucket providers by naming rule, in generate_provider_name's order
+    types = np.asarray(provider_types, dtype=str)
+    rules = np.select(
+        [np.char.find(types, keyword) >= 0 for keyword in ("Hospital", "Clinic", "Pharmacy", "Physician")],
+        ['hospital', 'clinic', 'pharmacy', 'physician'],
+        'other'
+    )
+    groups = {rule: np.flatnonzero(rules == rule) for rule in ('hospital', 'clinic', 'pharmacy', 'physician', 'other')}
+
+    names = np.empty(len(types), dtype=object)
+    hospitals = groups['hospital']
+    cities = pooled(batch_fake.city, len(hospitals))
+    names[hospitals] = joined(cities, ' ', choices(HOSPITAL_NAMES, len(hospitals)))
+    clinics = groups['clinic']
+    cities = pooled(batch_fake.city, len(clinics))
+    names[clinics] = joined(cities, ' ', choices(CLINIC_NAMES, len(clinics)))
+    pharmacies = groups['pharmacy']
+    last_names = pooled(batch_fake.last_name, len(pharmacies))
+    chains = choices(PHARMACY_CHAINS, len(pharmacies))
+    names[pharmacies] = np.where(chains == "Independent Pharmacy", np.char.add(last_names, "'s Pharmacy"), chains)
+    physicians = groups['physician']
+    names[physicians] = np.char.add('Dr. ', pooled(batch_fake.name, len(physicians)))
+    others = groups['other']
+    names[others] = joined(pooled(batch_fake.company, len(others)), ' ', types[others])
+
+    return [str(name) for name in names]
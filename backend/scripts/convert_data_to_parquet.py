@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Convert generated CSV data files to Parquet.
+The data loader reads Parquet when available, which is faster and lighter than CSV.
+"""
+import sys
+import os
+import pandas as pd
+
+TABLES = [
+    'patients', 'providers', 'pharmacies', 'policies',
+    'claims', 'diagnoses', 'procedures', 'medications'
+]
+
+
+def convert(data_dir: str = "data"):
+    """Convert every CSV table in data_dir to a Parquet file next to it."""
+    print(f"💾 Converting CSV files in {data_dir}/ to Parquet...")
+
+    for table in TABLES:
+        csv_path = os.path.join(data_dir, f"{table}.csv")
+        if not os.path.exists(csv_path):
+            print(f"   ⚠ {table}.csv not found, skipping")
+            continue
+
+        df = pd.read_csv(csv_path)
+        df.to_parquet(os.path.join(data_dir, f"{table}.parquet"), engine="pyarrow", index=False)
+        print(f"   ✓ {table}.parquet ({len(df):,} records)")
+
+    print("\n✅ Conversion complete!")
+
+
+if __name__ == "__main__":
+    convert(sys.argv[1] if len(sys.argv) > 1 else "data")
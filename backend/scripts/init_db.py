@@ -3,32 +3,92 @@ Script to initialize the SQLite database with tables and optional default data.
 """
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 
 # Add parent directory to path to import app modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app.db.sqlite_db import init_db, SessionLocal
-from app.models.auth_models import User
-from app.core.security import get_password_hash
+# App modules (SQLAlchemy engine, models, passlib/bcrypt) are imported inside the
+# functions that use them, so importing this script does not load them
+
+DEFAULT_ADMIN = {
+    "username": "admin",
+    "email": "admin@onezippy.ai",
+    "password": "admin123",
+    "is_active": True,
+    "is_superuser": True,
+}
+
+
+def _hash_many(passwords: List[str]) -> List[str]:
+    """
+    Hash passwords in parallel; bcrypt releases the GIL while hashing.
+
+    Args:
+        passwords: Plain text passwords
+
+    Returns:
+        Hashed passwords in input order
+    """
+    from app.core.security import get_password_hash
+
+    if len(passwords) <= 1:
+        return [get_password_hash(password) for password in passwords]
+    with ThreadPoolExecutor(max_workers=min(len(passwords), os.cpu_count() or 1)) as executor:
+        return list(executor.map(get_password_hash, passwords))
+
+
+def create_default_users(users: List[Dict]) -> int:
+    """
+    Create users in a single bulk insert.
+
+    Args:
+        users: User dicts with username, email, password and optional
+            is_active/is_superuser flags
+
+    Returns:
+        Number of users created
+    """
+    from app.db.sqlite_db import SessionLocal
+    from app.models.auth_models import User
+
+    hashed_passwords = _hash_many([user["password"] for user in users])
+
+    db = SessionLocal()
+    try:
+        user_objects = [
+            User(
+                username=user["username"],
+                email=user["email"],
+                hashed_password=hashed_password,
+                is_active=user.get("is_active", True),
+                is_superuser=user.get("is_superuser", False)
+            )
+            for user, hashed_password in zip(users, hashed_passwords)
+        ]
+        db.bulk_save_objects(user_objects)
+        db.commit()
+        return len(user_objects)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
 
 
 def create_default_admin():
     """Create a default admin user if no users exist."""
+    from app.db.sqlite_db import SessionLocal
+    from app.models.auth_models import User
+
     db = SessionLocal()
     try:
         # Check if any users exist
         user_count = db.query(User).count()
         if user_count == 0:
             # Create default admin user
-            admin_user = User(
-                username="admin",
-                email="admin@onezippy.ai",
-                hashed_password=get_password_hash("admin123"),
-                is_active=True,
-                is_superuser=True
-            )
-            db.add(admin_user)
-            db.commit()
+            create_default_users([DEFAULT_ADMIN])
             print("✓ Default admin user created (username: admin, password: admin123)")
         else:
             print(f"✓ Database already has {user_count} user(s)")
@@ -41,6 +101,9 @@ def create_default_admin():
 
 def main():
     """Main function to initialize database."""
+    from app.db.sqlite_db import init_db
+    from app.models import auth_models  # noqa: F401 (registers the tables with Base)
+
     print("Initializing SQLite database...")
 
     # Create tables
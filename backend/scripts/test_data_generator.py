@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test that the data generator is reproducible across worker counts.
+The same seed must give identical data whether patients are generated on 1 or N cores.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'dataset')))
+
+from health_data_generator import HealthInsuranceDataGenerator, PATIENTS_PER_WORKER
+
+
+# Enough patients for several worker chunks
+NUM_PATIENTS = 3 * PATIENTS_PER_WORKER
+NUM_CLAIMS = 2000
+SEED = 42
+
+
+def generate(n_jobs):
+    """
+    Generate a small dataset with the given number of worker processes.
+
+    Args:
+        n_jobs: Worker processes for patient generation
+
+    Returns:
+        Generator holding the generated tables
+    """
+    generator = HealthInsuranceDataGenerator(
+        num_patients=NUM_PATIENTS, num_claims=NUM_CLAIMS, seed=SEED, n_jobs=n_jobs
+    )
+    generator.generate_all_data()
+    return generator
+
+
+def main():
+    """Main test function."""
+    print("=" * 80)
+    print("🧪 DATA GENERATOR REPRODUCIBILITY TEST")
+    print("=" * 80)
+
+    worker_counts = (1, 4)
+    generators = [generate(n_jobs) for n_jobs in worker_counts]
+
+    print(f"\n🔁 Comparing output for seed {SEED} with {worker_counts[0]} and {worker_counts[1]} workers...")
+    failures = 0
+    for table in ('patients', 'providers', 'policies', 'claims'):
+        if getattr(generators[0], table).equals(getattr(generators[1], table)):
+            print(f"✓ {table} identical")
+        else:
+            print(f"❌ {table} differs")
+            failures += 1
+
+    print("\n" + "=" * 80)
+    if failures:
+        print(f"⚠ {failures} tables differ between worker counts")
+        print("=" * 80)
+        sys.exit(1)
+    print("✅ Output is independent of the worker count")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
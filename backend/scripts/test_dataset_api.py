@@ -3,15 +3,14 @@
 Test dataset viewing API endpoints.
 """
 import requests
-import json
 
 
 BASE_URL = "http://localhost:8001/api/v1"
 
 
-def login():
-    """Login and get access token."""
-    response = requests.post(
+def login(session):
+    """Login through the shared session and get access token."""
+    response = session.post(
         f"{BASE_URL}/auth/login",
         json={"username": "testuser", "password": "password123"}
     )
@@ -25,16 +24,20 @@ def main():
     print("🧪 DATASET API TEST SUITE")
     print("=" * 80)
 
-    token = login()
+    # One session keeps the connection alive across all test calls
+    session = requests.Session()
+    session.headers["User-Agent"] = "dataset-api-test"
+
+    token = login(session)
     if not token:
         print("❌ Login failed")
         return
 
-    headers = {"Authorization": f"Bearer {token}"}
+    session.headers["Authorization"] = f"Bearer {token}"
 
     # Test 1: Dataset stats
     print("\n📊 Test 1: Dataset Statistics")
-    response = requests.get(f"{BASE_URL}/dataset/stats", headers=headers)
+    response = session.get(f"{BASE_URL}/dataset/stats")
     if response.status_code == 200:
         stats = response.json()
         print("✓ Stats retrieved")
@@ -48,10 +51,7 @@ def main():
 
     # Test 2: Get patients
     print("\n👥 Test 2: Get Patients (page 1, 5 items)")
-    response = requests.get(
-        f"{BASE_URL}/dataset/patients?page=1&page_size=5",
-        headers=headers
-    )
+    response = session.get(f"{BASE_URL}/dataset/patients?page=1&page_size=5")
     if response.status_code == 200:
         data = response.json()
         print(f"✓ Retrieved {len(data['patients'])} patients (total: {data['total']})")
@@ -62,10 +62,7 @@ def main():
 
     # Test 3: Get providers
     print("\n🏥 Test 3: Get Providers (page 1, 5 items)")
-    response = requests.get(
-        f"{BASE_URL}/dataset/providers?page=1&page_size=5",
-        headers=headers
-    )
+    response = session.get(f"{BASE_URL}/dataset/providers?page=1&page_size=5")
     if response.status_code == 200:
         data = response.json()
         print(f"✓ Retrieved {len(data['providers'])} providers (total: {data['total']})")
@@ -76,10 +73,7 @@ def main():
 
     # Test 4: Get claims
     print("\n📄 Test 4: Get Claims (page 1, 5 items)")
-    response = requests.get(
-        f"{BASE_URL}/dataset/claims?page=1&page_size=5",
-        headers=headers
-    )
+    response = session.get(f"{BASE_URL}/dataset/claims?page=1&page_size=5")
     if response.status_code == 200:
         data = response.json()
         print(f"✓ Retrieved {len(data['claims'])} claims (total: {data['total']})")
@@ -91,10 +85,7 @@ def main():
 
     # Test 5: Get fraud claims only
     print("\n🚨 Test 5: Get Fraudulent Claims Only (first 3)")
-    response = requests.get(
-        f"{BASE_URL}/dataset/claims?fraud_only=true&page_size=3",
-        headers=headers
-    )
+    response = session.get(f"{BASE_URL}/dataset/claims?fraud_only=true&page_size=3")
     if response.status_code == 200:
         data = response.json()
         print(f"✓ Retrieved {len(data['claims'])} fraud claims (total: {data['total']})")
@@ -105,10 +96,7 @@ def main():
 
     # Test 6: Get specific patient
     print("\n👤 Test 6: Get Specific Patient")
-    response = requests.get(
-        f"{BASE_URL}/dataset/patients/PAT000001",
-        headers=headers
-    )
+    response = session.get(f"{BASE_URL}/dataset/patients/PAT000001")
     if response.status_code == 200:
         patient = response.json()
         print(f"✓ Retrieved patient: {patient['first_name']} {patient['last_name']}")
@@ -2,58 +2,110 @@
 """
 Test fraud detection API endpoints.
 """
-import requests
-import json
+import asyncio
+import heapq
+import os
+import statistics
+import time
+from operator import itemgetter
+
+import httpx
+import orjson
 
 
 BASE_URL = "http://localhost:8001/api/v1"
 
+# Responses retried with exponential backoff (RETRY_BACKOFF, then doubling), up to RETRY_ATTEMPTS times
+RETRY_STATUSES = {502, 503, 504}
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.3
+
+# Claims scored by test_fraud_detection, sent as concurrent batches of this size
+DETECT_CLAIMS = 50
+DETECT_BATCH_SIZE = 10
+
+# High-risk predictions shown in the detection report
+HIGH_RISK_LEVELS = {'HIGH', 'CRITICAL'}
+HIGH_RISK_SAMPLES = 3
+
+# Load testing: connection pool size, and concurrent copies of every detection batch to
+# time after the tests (set CONCURRENCY above 1 to run the benchmark)
+POOL = int(os.getenv("POOL", "32"))
+CONCURRENCY = int(os.getenv("CONCURRENCY", "1"))
+
+# Requests allowed in flight at once, so the fan-out cannot swamp the server's workers
+MAX_IN_FLIGHT = int(os.getenv("MAX_IN_FLIGHT", "8"))
+
+
+class RetryTransport(httpx.AsyncHTTPTransport):
+    """Transport that bounds requests in flight and retries gateway and unavailable responses, with backoff."""
+
+    def __init__(self, max_in_flight=MAX_IN_FLIGHT, **kwargs):
+        super().__init__(**kwargs)
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+
+    async def _send(self, request):
+        """Send one attempt and read its body while holding an in-flight slot."""
+        async with self._in_flight:
+            response = await super().handle_async_request(request)
+            await response.aread()
+            return response
+
+    async def handle_async_request(self, request):
+        for attempt in range(RETRY_ATTEMPTS):
+            response = await self._send(request)
+            if response.status_code not in RETRY_STATUSES:
+                return response
+            # Back off without holding a slot
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+        return await self._send(request)
+
+
+def create_client():
+    """Create an async client that reuses pooled keep-alive connections for every test call."""
+    transport = RetryTransport(
+        limits=httpx.Limits(max_connections=POOL, max_keepalive_connections=POOL),
+        retries=RETRY_ATTEMPTS
+    )
+    return httpx.AsyncClient(base_url=BASE_URL, transport=transport, timeout=30)
+
 
-def login():
-    """Login and get access token."""
+async def login(client):
+    """Login and get access token, registering the test user if it does not exist."""
     print("\n🔐 Logging in...")
-    response = requests.post(
-        f"{BASE_URL}/auth/login",
-        json={
-            "username": "testuser",
-            "password": "password123"
-        }
-    )
+    credentials = {
+        "username": "testuser",
+        "password": "password123"
+    }
 
-    if response.status_code == 200:
-        data = response.json()
-        print("✓ Login successful")
-        return data['access_token']
-    elif response.status_code == 404:
+    response = await client.post("/auth/login", json=credentials)
+    if response.status_code == 404:
         # User doesn't exist, register first
         print("  User not found, registering...")
-        register_response = requests.post(
-            f"{BASE_URL}/auth/register",
-            json={
-                "username": "testuser",
-                "email": "test@example.com",
-                "password": "password123"
-            }
+        register_response = await client.post(
+            "/auth/register",
+            json={**credentials, "email": "test@example.com"}
         )
 
-        if register_response.status_code == 201:
-            print("✓ Registration successful, logging in...")
-            return login()
-        else:
+        if register_response.status_code != 201:
             print(f"❌ Registration failed: {register_response.text}")
             return None
+        print("✓ Registration successful, logging in...")
+        response = await client.post("/auth/login", json=credentials)
+
+    if response.status_code == 200:
+        data = response.json()
+        print("✓ Login successful")
+        return data['access_token']
     else:
         print(f"❌ Login failed: {response.text}")
         return None
 
 
-def test_fraud_health(token):
+async def test_fraud_health(client):
     """Test fraud detection health endpoint."""
+    response = await client.get("/fraud/health")
     print("\n🏥 Testing fraud detection health...")
-    response = requests.get(
-        f"{BASE_URL}/fraud/health",
-        headers={"Authorization": f"Bearer {token}"}
-    )
 
     if response.status_code == 200:
         data = response.json()
@@ -67,13 +119,10 @@ def test_fraud_health(token):
         return False
 
 
-def test_fraud_statistics(token):
+async def test_fraud_statistics(client):
     """Test fraud statistics endpoint."""
+    response = await client.get("/fraud/statistics")
     print("\n📊 Testing fraud statistics...")
-    response = requests.get(
-        f"{BASE_URL}/fraud/statistics",
-        headers={"Authorization": f"Bearer {token}"}
-    )
 
     if response.status_code == 200:
         data = response.json()
@@ -88,13 +137,10 @@ def test_fraud_statistics(token):
         return False
 
 
-def test_model_performance(token):
+async def test_model_performance(client):
     """Test model performance endpoint."""
+    response = await client.get("/fraud/model/performance")
     print("\n📈 Testing model performance...")
-    response = requests.get(
-        f"{BASE_URL}/fraud/model/performance",
-        headers={"Authorization": f"Bearer {token}"}
-    )
 
     if response.status_code == 200:
         data = response.json()
@@ -109,13 +155,10 @@ def test_model_performance(token):
         return False
 
 
-def test_feature_importance(token):
+async def test_feature_importance(client):
     """Test feature importance endpoint."""
+    response = await client.get("/fraud/model/feature-importance?top_n=10")
     print("\n🔍 Testing feature importance...")
-    response = requests.get(
-        f"{BASE_URL}/fraud/model/feature-importance?top_n=10",
-        headers={"Authorization": f"Bearer {token}"}
-    )
 
     if response.status_code == 200:
         data = response.json()
@@ -129,28 +172,56 @@ def test_feature_importance(token):
         return False
 
 
-def test_fraud_detection(token):
-    """Test fraud detection endpoint."""
-    print("\n🔬 Testing fraud detection (analyzing 50 claims)...")
-    response = requests.post(
-        f"{BASE_URL}/fraud/detect",
-        json={"limit": 50},
-        headers={"Authorization": f"Bearer {token}"}
-    )
+async def score_batch(client, offset):
+    """
+    Score one batch of claims and reduce it to what the report needs.
 
-    if response.status_code == 200:
-        data = response.json()
-        print(f"✓ Fraud detection complete")
-        print(f"  Total analyzed: {data['total_analyzed']}")
-        print(f"  Fraud detected: {data['fraud_detected']}")
-        print(f"  Fraud rate: {data['fraud_rate']*100:.1f}%")
+    Args:
+        client: Shared async client
+        offset: Index of the batch's first claim
+
+    Returns:
+        Tuple of (totals, top high-risk predictions), or (None, error text) if the request failed
+    """
+    response = await client.post("/fraud/detect", json={"offset": offset, "limit": DETECT_BATCH_SIZE})
+    if response.status_code != 200:
+        return None, response.text
+
+    # Keep the counts and the top few high-risk predictions; drop the rest of the batch
+    data = orjson.loads(response.content)
+    high_risk = [p for p in data['predictions'] if p['risk_level'] in HIGH_RISK_LEVELS]
+    totals = (data['total_analyzed'], data['fraud_detected'], len(high_risk))
+    return totals, heapq.nlargest(HIGH_RISK_SAMPLES, high_risk, key=itemgetter('fraud_probability'))
+
+
+async def test_fraud_detection(client):
+    """Test fraud detection endpoint, scoring the claims in parallel batches."""
+    offsets = range(0, DETECT_CLAIMS, DETECT_BATCH_SIZE)
+    batches = await asyncio.gather(*[score_batch(client, offset) for offset in offsets])
+    print(f"\n🔬 Testing fraud detection (analyzing {DETECT_CLAIMS} claims in {len(batches)} batches)...")
 
-        # Show some high-risk predictions
-        high_risk = [p for p in data['predictions'] if p['risk_level'] in ['HIGH', 'CRITICAL']]
-        if high_risk:
-            print(f"\n  High-risk claims found: {len(high_risk)}")
-            print(f"\n  Sample high-risk predictions:")
-            for pred in high_risk[:3]:
+    errors = [result for totals, result in batches if totals is None]
+    if not errors:
+        total_analyzed = sum(totals[0] for totals, _ in batches)
+        fraud_detected = sum(totals[1] for totals, _ in batches)
+        high_risk_count = sum(totals[2] for totals, _ in batches)
+        fraud_rate = fraud_detected / total_analyzed if total_analyzed > 0 else 0
+
+        print(f"✓ Fraud detection complete")
+        print(f"  Total analyzed: {total_analyzed}")
+        print(f"  Fraud detected: {fraud_detected}")
+        print(f"  Fraud rate: {fraud_rate*100:.1f}%")
+
+        # Show the highest-risk predictions
+        if high_risk_count:
+            samples = heapq.nlargest(
+                HIGH_RISK_SAMPLES,
+                (pred for _, top in batches for pred in top),
+                key=itemgetter('fraud_probability')
+            )
+            print(f"\n  High-risk claims found: {high_risk_count}")
+            print(f"\n  Highest-risk predictions:")
+            for pred in samples:
                 print(f"    - Claim {pred['claim_id']}")
                 print(f"      Risk: {pred['risk_level']} ({pred['fraud_probability']*100:.1f}%)")
                 print(f"      Amount: ${pred['claim_amount']:.2f}")
@@ -161,40 +232,98 @@ def test_fraud_detection(token):
 
         return True
     else:
-        print(f"❌ Fraud detection failed: {response.text}")
+        print(f"❌ Fraud detection failed: {errors[0]}")
+        return False
+
+
+async def test_offset_past_end(client):
+    """Test that an offset past the last claim returns an empty result instead of an error."""
+    response = await client.post("/fraud/detect", json={"offset": 10_000_000, "limit": 5})
+    print("\n📭 Testing fraud detection past the last claim...")
+
+    if response.status_code == 200:
+        data = response.json()
+        if data['total_analyzed'] == 0 and not data['predictions']:
+            print(f"✓ Empty result returned")
+            return True
+        print(f"❌ Expected no predictions, got {data['total_analyzed']}")
+        return False
+    else:
+        print(f"❌ Out-of-range offset failed: {response.text}")
         return False
 
 
-def main():
+async def timed(coro, latencies):
+    """
+    Await a request coroutine and record how long it took.
+
+    Args:
+        coro: Coroutine sending one request
+        latencies: List the elapsed time in nanoseconds is appended to
+
+    Returns:
+        The coroutine's result
+    """
+    start = time.perf_counter_ns()
+    result = await coro
+    latencies.append(time.perf_counter_ns() - start)
+    return result
+
+
+async def bench(client):
+    """Send CONCURRENCY concurrent copies of every detection batch and report latency percentiles."""
+    latencies = []
+    offsets = range(0, DETECT_CLAIMS, DETECT_BATCH_SIZE)
+    start = time.perf_counter_ns()
+    batches = await asyncio.gather(*[
+        timed(score_batch(client, offset), latencies)
+        for _ in range(CONCURRENCY) for offset in offsets
+    ])
+    elapsed = (time.perf_counter_ns() - start) / 1e9
+
+    print(f"\n⏱  Benchmark: {len(batches)} detection requests, concurrency {CONCURRENCY}, "
+          f"pool {POOL}, max in flight {MAX_IN_FLIGHT}")
+    failed = sum(1 for totals, _ in batches if totals is None)
+    if failed:
+        print(f"  ⚠ {failed} requests failed")
+
+    cuts = statistics.quantiles(latencies, n=100)
+    print(f"  Throughput: {len(batches) / elapsed:.1f} requests/s")
+    print(f"  Latency p50: {cuts[49] / 1e6:.1f} ms")
+    print(f"  Latency p95: {cuts[94] / 1e6:.1f} ms")
+    print(f"  Latency p99: {cuts[98] / 1e6:.1f} ms")
+
+
+async def main():
     """Main test function."""
     print("=" * 80)
     print("🧪 FRAUD DETECTION API TEST SUITE")
     print("=" * 80)
 
-    # Login
-    token = login()
-    if not token:
-        print("\n❌ Could not authenticate. Exiting.")
-        return
-
-    # Run tests
-    tests_passed = 0
-    tests_total = 5
-
-    if test_fraud_health(token):
-        tests_passed += 1
-
-    if test_fraud_statistics(token):
-        tests_passed += 1
-
-    if test_model_performance(token):
-        tests_passed += 1
+    async with create_client() as client:
+        # Login, then send the token with every request on the shared client
+        token = await login(client)
+        if not token:
+            print("\n❌ Could not authenticate. Exiting.")
+            return
+        client.headers["Authorization"] = f"Bearer {token}"
+
+        # The tests are independent, so they run concurrently; each one prints
+        # only after its response arrives, so their output does not interleave
+        results = await asyncio.gather(
+            test_fraud_health(client),
+            test_fraud_statistics(client),
+            test_model_performance(client),
+            test_feature_importance(client),
+            test_fraud_detection(client),
+            test_offset_past_end(client)
+        )
 
-    if test_feature_importance(token):
-        tests_passed += 1
+        if CONCURRENCY > 1:
+            await bench(client)
 
-    if test_fraud_detection(token):
-        tests_passed += 1
+    tests_passed = sum(1 for passed in results if passed)
+    tests_total = len(results)
 
     # Summary
     print("\n" + "=" * 80)
@@ -208,4 +337,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
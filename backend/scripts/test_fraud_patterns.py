@@ -4,163 +4,198 @@ Shows how easy it is to work with and query fraud patterns.
 """
 import sys
 import os
+import numpy as np
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from dataset.medical_codes import FRAUD_PATTERNS
 
 
+# Report separators
+_BAR = "=" * 80
+_THIN = "-" * 80
+
+# Color coding based on severity, keyed like the raw pattern data
+_SEVERITY_EMOJI = {
+    'critical': '🔴',
+    'high': '🟠',
+    'medium': '🟡',
+    'low': '🟢',
+}
+
+
+# Pattern fields read once at import, as parallel tuples with one entry per pattern
+_NAMES, _SEVERITIES, _DIFFICULTIES, _AVG_LOSSES, _GRAPH_PATTERNS = (tuple(column) for column in zip(*[
+    (
+        pattern_name,
+        pattern_data.get('severity', 'unknown'),
+        pattern_data.get('detection_difficulty', 'unknown'),
+        pattern_data.get('avg_loss', 0),
+        pattern_data.get('graph_pattern'),
+    )
+    for pattern_name, pattern_data in FRAUD_PATTERNS.items()
+]))
+
+
+def _write_lines(lines):
+    """
+    Write buffered report lines to stdout in one call, then clear the buffer.
+
+    Args:
+        lines: Lines to write (without trailing newlines)
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    lines.clear()
+
+
 def analyze_fraud_patterns():
     """Analyze and display all fraud patterns in the system."""
-    print("=" * 80)
-    print("HEALTH INSURANCE FRAUD DETECTION SYSTEM - PATTERN ANALYSIS")
-    print("=" * 80)
-    print()
+    out = []
+    out.append(_BAR)
+    out.append("HEALTH INSURANCE FRAUD DETECTION SYSTEM - PATTERN ANALYSIS")
+    out.append(_BAR)
+    out.append("")
 
     total_patterns = len(FRAUD_PATTERNS)
-    print(f"📊 Total Fraud Patterns: {total_patterns}")
-    print()
+    out.append(f"📊 Total Fraud Patterns: {total_patterns}")
+    out.append("")
 
-    # Group by severity
-    by_severity = {}
-    by_difficulty = {}
-    total_avg_loss = 0
+    # Group by severity and difficulty: factorize to codes, then count each code
+    severities, severity_codes = np.unique(_SEVERITIES, return_inverse=True)
+    difficulties, difficulty_codes = np.unique(_DIFFICULTIES, return_inverse=True)
+    by_severity = dict(zip(severities.tolist(), np.bincount(severity_codes).tolist()))
+    by_difficulty = dict(zip(difficulties.tolist(), np.bincount(difficulty_codes).tolist()))
 
-    for pattern_name, pattern_data in FRAUD_PATTERNS.items():
-        severity = pattern_data.get('severity', 'unknown')
-        difficulty = pattern_data.get('detection_difficulty', 'unknown')
-        avg_loss = pattern_data.get('avg_loss', 0)
-
-        by_severity[severity] = by_severity.get(severity, 0) + 1
-        by_difficulty[difficulty] = by_difficulty.get(difficulty, 0) + 1
-        total_avg_loss += avg_loss
+    losses = np.asarray(_AVG_LOSSES)
+    total_avg_loss = losses.sum().item()
+    mean_avg_loss = losses.mean().item()
 
     # Display summary statistics
-    print("📈 SUMMARY STATISTICS")
-    print("-" * 80)
-    print(f"Average Loss per Pattern: ${total_avg_loss / total_patterns:,.0f}")
-    print(f"Total Estimated Annual Loss (assuming 1000 incidents each): ${total_avg_loss * 1000:,.0f}")
-    print()
+    out.append("📈 SUMMARY STATISTICS")
+    out.append(_THIN)
+    out.append(f"Average Loss per Pattern: ${mean_avg_loss:,.0f}")
+    out.append(f"Total Estimated Annual Loss (assuming 1000 incidents each): ${total_avg_loss * 1000:,.0f}")
+    out.append("")
 
-    print("Patterns by Severity:")
+    out.append("Patterns by Severity:")
     for severity, count in sorted(by_severity.items()):
-        print(f"  • {severity.upper()}: {count} patterns")
-    print()
+        out.append(f"  • {severity.upper()}: {count} patterns")
+    out.append("")
 
-    print("Patterns by Detection Difficulty:")
+    out.append("Patterns by Detection Difficulty:")
     for difficulty, count in sorted(by_difficulty.items()):
-        print(f"  • {difficulty.title()}: {count} patterns")
-    print()
+        out.append(f"  • {difficulty.title()}: {count} patterns")
+    out.append("")
+
+    _write_lines(out)
 
     # Display all patterns
-    print("=" * 80)
-    print("📋 ALL FRAUD PATTERNS")
-    print("=" * 80)
-    print()
-
-    for i, (pattern_name, pattern_data) in enumerate(FRAUD_PATTERNS.items(), 1):
-        severity = pattern_data.get('severity', 'unknown').upper()
-        avg_loss = pattern_data.get('avg_loss', 0)
-        difficulty = pattern_data.get('detection_difficulty', 'unknown')
-        graph_pattern = pattern_data.get('graph_pattern')
-
-        # Color coding based on severity
-        severity_emoji = {
-            'CRITICAL': '🔴',
-            'HIGH': '🟠',
-            'MEDIUM': '🟡',
-            'LOW': '🟢',
-        }.get(severity, '⚪')
-
-        print(f"{i}. {severity_emoji} {pattern_name.upper().replace('_', ' ')}")
-        print(f"   Description: {pattern_data['description']}")
-        print(f"   Severity: {severity} | Detection: {difficulty.title()} | Avg Loss: ${avg_loss:,.0f}")
+    out.append(_BAR)
+    out.append("📋 ALL FRAUD PATTERNS")
+    out.append(_BAR)
+    out.append("")
+
+    # The graph and critical sections are collected in the same pass
+    graph_patterns = []
+    critical_patterns = []
+
+    pattern_fields = zip(_NAMES, _SEVERITIES, _DIFFICULTIES, _AVG_LOSSES, _GRAPH_PATTERNS)
+    for i, (pattern_name, severity, difficulty, avg_loss, graph_pattern) in enumerate(pattern_fields, 1):
+        pattern_data = FRAUD_PATTERNS[pattern_name]
+        if severity == 'critical':
+            critical_patterns.append((pattern_name, avg_loss))
+
+        out.append(f"{i}. {_SEVERITY_EMOJI.get(severity, '⚪')} {pattern_name.upper().replace('_', ' ')}")
+        out.append(f"   Description: {pattern_data['description']}")
+        out.append(f"   Severity: {severity.upper()} | Detection: {difficulty.title()} | Avg Loss: ${avg_loss:,.0f}")
 
         if 'indicators' in pattern_data:
             indicators = ', '.join(pattern_data['indicators'])
-            print(f"   Indicators: {indicators}")
+            out.append(f"   Indicators: {indicators}")
 
         if graph_pattern:
-            print(f"   Graph Pattern: {graph_pattern}")
+            out.append(f"   Graph Pattern: {graph_pattern}")
+            graph_patterns.append((pattern_name, graph_pattern))
 
-        print()
+        out.append("")
 
-    # Display patterns requiring graph analysis
-    print("=" * 80)
-    print("🕸️  PATTERNS REQUIRING GRAPH ANALYSIS")
-    print("=" * 80)
-    print()
+    _write_lines(out)
 
-    graph_patterns = [(name, data) for name, data in FRAUD_PATTERNS.items()
-                      if data.get('graph_pattern')]
+    # Display patterns requiring graph analysis
+    out.append(_BAR)
+    out.append("🕸️  PATTERNS REQUIRING GRAPH ANALYSIS")
+    out.append(_BAR)
+    out.append("")
 
     if graph_patterns:
-        for pattern_name, pattern_data in graph_patterns:
-            print(f"• {pattern_name.replace('_', ' ').title()}")
-            print(f"  Graph Pattern: {pattern_data['graph_pattern']}")
-            print(f"  Why Graph?: Complex network relationships needed for detection")
-            print()
+        for pattern_name, graph_pattern in graph_patterns:
+            out.append(f"• {pattern_name.replace('_', ' ').title()}")
+            out.append(f"  Graph Pattern: {graph_pattern}")
+            out.append(f"  Why Graph?: Complex network relationships needed for detection")
+            out.append("")
     else:
-        print("No patterns currently require graph analysis.")
-        print()
+        out.append("No patterns currently require graph analysis.")
+        out.append("")
+
+    _write_lines(out)
 
     # Display critical patterns
-    print("=" * 80)
-    print("⚠️  CRITICAL SEVERITY PATTERNS (Priority Detection)")
-    print("=" * 80)
-    print()
-
-    critical_patterns = [(name, data) for name, data in FRAUD_PATTERNS.items()
-                         if data.get('severity') == 'critical']
-
-    for pattern_name, pattern_data in critical_patterns:
-        print(f"🔴 {pattern_name.upper().replace('_', ' ')}")
-        print(f"   {pattern_data['description']}")
-        print(f"   Average Loss: ${pattern_data.get('avg_loss', 0):,.0f}")
-        print()
-
-    print("=" * 80)
-    print("✅ PATTERN SYSTEM READY FOR ML TRAINING")
-    print("=" * 80)
-    print()
-    print("Next Steps:")
-    print("1. Generate synthetic data with these patterns")
-    print("2. Load into Memgraph graph database")
-    print("3. Extract features for ML model training")
-    print("4. Train fraud detection classifier")
-    print("5. Deploy and monitor in production")
-    print()
+    out.append(_BAR)
+    out.append("⚠️  CRITICAL SEVERITY PATTERNS (Priority Detection)")
+    out.append(_BAR)
+    out.append("")
+
+    for pattern_name, avg_loss in critical_patterns:
+        out.append(f"🔴 {pattern_name.upper().replace('_', ' ')}")
+        out.append(f"   {FRAUD_PATTERNS[pattern_name]['description']}")
+        out.append(f"   Average Loss: ${avg_loss:,.0f}")
+        out.append("")
+
+    out.append(_BAR)
+    out.append("✅ PATTERN SYSTEM READY FOR ML TRAINING")
+    out.append(_BAR)
+    out.append("")
+    out.append("Next Steps:")
+    out.append("1. Generate synthetic data with these patterns")
+    out.append("2. Load into Memgraph graph database")
+    out.append("3. Extract features for ML model training")
+    out.append("4. Train fraud detection classifier")
+    out.append("5. Deploy and monitor in production")
+    out.append("")
+    _write_lines(out)
 
 
 def demonstrate_extensibility():
     """Show how easy it is to add a new pattern."""
-    print("=" * 80)
-    print("🎯 DEMONSTRATING EXTENSIBILITY")
-    print("=" * 80)
-    print()
-
-    print("To add a NEW fraud pattern, simply add to FRAUD_PATTERNS dict:")
-    print()
-    print("```python")
-    print('FRAUD_PATTERNS = {')
-    print('    # ... existing patterns ...')
-    print()
-    print('    "your_new_pattern": {')
-    print('        "description": "What the fraud is",')
-    print('        "indicators": ["signal1", "signal2"],')
-    print('        "severity": "high",')
-    print('        "avg_loss": 2000,')
-    print('        "detection_difficulty": "medium"')
-    print('    }')
-    print('}')
-    print("```")
-    print()
-    print("That's it! No other code changes needed.")
-    print("The pattern will automatically:")
-    print("  ✓ Be available in data generation")
-    print("  ✓ Be included in ML feature extraction")
-    print("  ✓ Appear in frontend visualizations")
-    print("  ✓ Be tracked in analytics dashboards")
-    print()
+    out = []
+    out.append(_BAR)
+    out.append("🎯 DEMONSTRATING EXTENSIBILITY")
+    out.append(_BAR)
+    out.append("")
+
+    out.append("To add a NEW fraud pattern, simply add to FRAUD_PATTERNS dict:")
+    out.append("")
+    out.append("```python")
+    out.append('FRAUD_PATTERNS = {')
+    out.append('    # ... existing patterns ...')
+    out.append("")
+    out.append('    "your_new_pattern": {')
+    out.append('        "description": "What the fraud is",')
+    out.append('        "indicators": ["signal1", "signal2"],')
+    out.append('        "severity": "high",')
+    out.append('        "avg_loss": 2000,')
+    out.append('        "detection_difficulty": "medium"')
+    out.append('    }')
+    out.append('}')
+    out.append("```")
+    out.append("")
+    out.append("That's it! No other code changes needed.")
+    out.append("The pattern will automatically:")
+    out.append("  ✓ Be available in data generation")
+    out.append("  ✓ Be included in ML feature extraction")
+    out.append("  ✓ Appear in frontend visualizations")
+    out.append("  ✓ Be tracked in analytics dashboards")
+    out.append("")
+    _write_lines(out)
 
 
 if __name__ == "__main__":